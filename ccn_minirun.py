@@ -3,24 +3,20 @@
 import os
 import sys
 import json
+import functools
 import click
+import orjson
 from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.json import JSON
-from rich.traceback import install
 
-from llm_client import LLMClient, LLMError
-from template_loader import repo as template_repo
-from worker_node import WorkerNode
-from mini_ccn import MiniCCN, CCNError
-from jsonschema import validate, ValidationError
+# rich, fastjsonschema and the CCN pipeline modules are imported lazily so
+# that `--help` and argument errors do not pay for them.
 
 
-# Install rich traceback handler
-install(show_locals=True)
-
-console = Console()
+@functools.lru_cache(maxsize=1)
+def get_console():
+    """Return the shared rich Console, creating it on first use."""
+    from rich.console import Console
+    return Console()
 
 
 def validate_environment() -> str:
@@ -31,6 +27,7 @@ def validate_environment() -> str:
     """
     from llm_config import get_default_llm_config
 
+    console = get_console()
     # Get provider from configuration (templates can override)
     config = get_default_llm_config()
     provider = config.get("provider", "groq")
@@ -50,21 +47,48 @@ def validate_environment() -> str:
     return provider
 
 
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schemas', 'memory_record.schema.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_schema() -> dict:
+    """Read and parse the memory record schema once per process."""
+    with open(SCHEMA_PATH, 'r') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator():
+    """Compile a validator for a whole archive (array of memory records).
+
+    Validating the list in one call lets fastjsonschema's generated code loop
+    over records instead of paying per-call overhead for each one. Formats
+    are treated as annotations (as jsonschema does by default), so naive ISO
+    timestamps from PerRoleRecord.to_dict() remain valid.
+    """
+    import fastjsonschema
+
+    record_schema = _load_schema()
+    archive_schema = {
+        "$schema": record_schema.get("$schema"),
+        "type": "array",
+        "items": record_schema,
+    }
+    # Generated validators stop at the first failing record; callers only need a verdict
+    return fastjsonschema.compile(archive_schema, use_formats=False)
+
+
 def validate_archive(archive_data: list, strict: bool = False) -> bool:
     """Validate archive against schema."""
+    import fastjsonschema
+
     try:
-        schema_path = os.path.join(os.path.dirname(__file__), 'schemas', 'memory_record.schema.json')
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-        
-        for record in archive_data:
-            validate(record, schema)
-        
+        _get_validator()(archive_data)
         return True
-    except (ValidationError, FileNotFoundError) as e:
+    except (fastjsonschema.JsonSchemaException, FileNotFoundError) as e:
         if strict:
             raise
-        console.print(f"[yellow]Warning: Archive validation failed: {e}[/yellow]")
+        get_console().print(f"[yellow]Warning: Archive validation failed: {e}[/yellow]")
         return False
 
 
@@ -80,6 +104,8 @@ def validate_archive(archive_data: list, strict: bool = False) -> bool:
               help='Only validate setup without executing')
 @click.option('--ccn-dispatch', is_flag=True,
               help='Dispatch built-in steps in CCN using call_plan')
+@click.option('--max-inflight', type=click.IntRange(min=1), default=8, show_default=True,
+              help='Maximum concurrent worker LLM calls')
 def main(
     query: str,
     debug: bool,
@@ -87,6 +113,7 @@ def main(
     output: Optional[str],
     validate_only: bool,
     ccn_dispatch: bool,
+    max_inflight: int,
 ) -> None:
     """Run the CCN minimal EPN cycle with the given query.
     
@@ -95,8 +122,21 @@ def main(
     Example:
         ccn_minirun "What are the key principles of machine learning?"
     """
-    
+    console = get_console()
+
     try:
+        # Install rich traceback handler and load the pipeline on demand
+        from rich.panel import Panel
+        from rich.traceback import install
+
+        install(show_locals=True)
+
+        from llm_client import LLMClient
+        from mini_ccn import MiniCCN, CCNError
+        from mini_memory import PerRoleRecord
+        from template_loader import repo as template_repo
+        from worker_node import WorkerNode
+
         # Validate environment and get provider
         provider = validate_environment()
 
@@ -113,7 +153,8 @@ def main(
         
         # Initialize worker and CCN
         worker_node = WorkerNode(llm_client)
-        ccn = MiniCCN(worker_node, debug=debug, dispatch_in_ccn=ccn_dispatch)
+        ccn = MiniCCN(worker_node, debug=debug, dispatch_in_ccn=ccn_dispatch,
+                      max_inflight=max_inflight)
         
         if validate_only:
             console.print("[green]✓ Setup validation successful[/green]")
@@ -145,15 +186,19 @@ def main(
             console.print(f"  Aggregator entries: {summary['aggregator_size']}")
 
             console.print("\n[bold]Metrics (JSON):[/bold]")
-            console.print(json.dumps(metrics))
+            console.print(orjson.dumps(metrics).decode())
+
+            # Materialize archive/event dicts once; reused for validation, output and debug
+            archive_data = list(map(PerRoleRecord.to_dict, ccn.memory.archive))
+            event_data = ccn.memory.run_log.to_dicts()
 
             console.print("\n[bold]Event Log (JSON lines):[/bold]")
-            for event in ccn.memory.run_log:
-                console.print(json.dumps(event.to_dict()))
+            # Render the JSON lines as one raw block: no markup, no per-event flush
+            event_lines = b"\n".join(orjson.dumps(event) for event in event_data)
+            console.out(event_lines.decode(), highlight=False)
             
             # Validate archive if strict mode
             if strict:
-                archive_data = [record.to_dict() for record in ccn.memory.archive]
                 if validate_archive(archive_data, strict=True):
                     console.print("[green]✓ Archive validation passed[/green]")
             
@@ -163,20 +208,21 @@ def main(
                     'query': effective_query,
                     'result': result,
                     'summary': summary,
-                    'archive': [record.to_dict() for record in ccn.memory.archive],
-                    'events': [event.to_dict() for event in ccn.memory.run_log]
+                    'archive': archive_data,
+                    'events': event_data
                 }
                 
-                with open(output, 'w') as f:
-                    json.dump(output_data, f, indent=2)
+                # Serialize once and write the bytes in a single call
+                with open(output, 'wb') as f:
+                    f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
                 console.print(f"[green]✓ Results saved to {output}[/green]")
             
             # Debug output
             if debug:
                 console.print(f"\n[bold yellow]Debug Information:[/bold yellow]")
                 console.print("Archive Records:")
-                for record in ccn.memory.archive:
-                    console.print(JSON(json.dumps(record.to_dict(), indent=2)))
+                # One highlighted render of the whole archive; no dumps/re-parse per record
+                console.print_json(data=archive_data)
         
         except CCNError as e:
             console.print(f"[red]CCN Execution Error: {e}[/red]")
@@ -189,6 +235,9 @@ def main(
             if debug:
                 console.print_exception()
             sys.exit(1)
+
+        finally:
+            ccn.close()
     
     except KeyboardInterrupt:
         console.print("\n[yellow]Execution interrupted by user[/yellow]")
@@ -2,25 +2,138 @@
 
 from __future__ import annotations
 
-import os
-from typing import Any, Dict, Optional
+import atexit
+import copy
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, NotFoundError, OpenAI
 
-from llm_providers import LLMProvider
+from llm_providers import _ENV_SNAPSHOT, LLMProvider, register
 
+# One connection pool for every DeepSeekProvider in the process: reuses TCP/TLS
+# sessions across instances and multiplexes requests over HTTP/2.
+_shared_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+)
+atexit.register(_shared_http_client.close)
 
+# Async pools bind to the event loop that first uses them, so each provider
+# gets its own; concurrent worker calls are multiplexed over HTTP/2 on it.
+_ASYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+@register("deepseek")
 class DeepSeekProvider(LLMProvider):
     """DeepSeek API provider implementation."""
 
+    __slots__ = (
+        "client", "aclient", "_last_raw_response",
+        "_cache", "_connection_verified", "_msg_buf"
+    )
+
+    # Max number of deterministic async responses kept; blocking calls are
+    # cached one layer up, by LLMClient
+    CACHE_SIZE = 128
+
     def __init__(self, api_key: str):
         """Initialize DeepSeek provider."""
         super().__init__(api_key)
         self.client = OpenAI(
             api_key=api_key,
-            base_url="https://api.deepseek.com"
+            base_url="https://api.deepseek.com",
+            http_client=_shared_http_client
+        )
+        self.aclient = AsyncOpenAI(
+            api_key=api_key,
+            base_url="https://api.deepseek.com",
+            http_client=httpx.AsyncClient(http2=True, limits=_ASYNC_LIMITS)
         )
         self._last_raw_response: Optional[str] = None
+        # LRU of deterministic (temperature == 0) async responses keyed by request content
+        self._cache: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._connection_verified: bool = False
+        # Reused messages payload for the blocking path; the SDK serializes the
+        # request body before returning control, so mutating it per call is safe.
+        # The async path builds its own list because calls may interleave.
+        self._msg_buf = [{"role": "user", "content": ""}]
+
+    @staticmethod
+    def _cache_key(
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]]
+    ) -> str:
+        """Return a stable hash identifying a deterministic completion request."""
+        payload = orjson.dumps(
+            {
+                "model": model,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "response_format": response_format,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def _lookup_cache(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache_key, cached_result); key is None for sampled calls."""
+        if temperature != 0.0:
+            return None, None
+        cache_key = self._cache_key(prompt, model, max_tokens, response_format)
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        self._cache.move_to_end(cache_key)
+        self._last_raw_response, result = cached
+        return cache_key, copy.deepcopy(result)
+
+    @staticmethod
+    def _extract_content(completion: Any) -> str:
+        """Return the first choice's message content, failing explicitly if empty."""
+        choices = completion.choices
+        if not choices:
+            raise ValueError("DeepSeek response contained no choices")
+        content = choices[0].message.content
+        if not content:
+            raise ValueError("DeepSeek response contained empty content")
+        return content
+
+    def _handle_content(
+        self,
+        content: str,
+        response_format: Optional[Dict[str, Any]],
+        cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """Record the raw body, parse it and populate the cache if applicable."""
+        self._last_raw_response = content
+
+        # Handle JSON response
+        if response_format and response_format.get("type") == "json_object":
+            try:
+                result = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse JSON response: {e}\nContent: {content}")
+        else:
+            result = {"content": content}
+
+        if cache_key is not None:
+            self._cache[cache_key] = (content, copy.deepcopy(result))
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
 
     def call_completion(
         self,
@@ -31,8 +144,13 @@ class DeepSeekProvider(LLMProvider):
         reasoning_effort: Optional[str] = None,
         response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make a chat completion call using DeepSeek API."""
-        messages = [{"role": "user", "content": prompt}]
+        """Make a chat completion call using DeepSeek API.
+
+        Not cached here: LLMClient already memoizes deterministic blocking
+        calls, so a second cache would only duplicate its entries.
+        """
+        self._msg_buf[0]["content"] = prompt
+        messages = self._msg_buf
 
         # DeepSeek uses max_tokens (OpenAI-compatible)
         completion = self.client.chat.completions.create(
@@ -43,18 +161,41 @@ class DeepSeekProvider(LLMProvider):
             response_format=response_format
         )
 
-        content = completion.choices[0].message.content
-        self._last_raw_response = content
+        return self._handle_content(self._extract_content(completion), response_format, None)
 
-        # Handle JSON response
-        if response_format and response_format.get("type") == "json_object":
-            import json
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Failed to parse JSON response: {e}\nContent: {content}")
+    async def acall_completion(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        reasoning_effort: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Awaitable chat completion using the async DeepSeek client.
+
+        Calls with temperature 0.0 are deterministic and served from an
+        in-memory cache on repeat; sampled calls always hit the API.
+        """
+        cache_key, cached = self._lookup_cache(prompt, model, temperature, max_tokens, response_format)
+        if cached is not None:
+            return cached
 
-        return {"content": content}
+        messages = [{"role": "user", "content": prompt}]
+
+        completion = await self.aclient.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format
+        )
+
+        return self._handle_content(self._extract_content(completion), response_format, cache_key)
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool."""
+        await self.aclient.close()
 
     def get_provider_name(self) -> str:
         """Return provider name."""
@@ -67,13 +208,31 @@ class DeepSeekProvider(LLMProvider):
     @classmethod
     def get_api_key_from_env(cls) -> str:
         """Get API key from environment variable."""
-        api_key = os.environ.get("DEEPSEEK_API_KEY")
+        api_key = _ENV_SNAPSHOT["DEEPSEEK_API_KEY"]
         if not api_key:
             raise ValueError("DEEPSEEK_API_KEY environment variable is required")
         return api_key
 
     def test_connection(self) -> bool:
-        """Test basic connectivity to DeepSeek API."""
+        """Test basic connectivity to DeepSeek API.
+
+        Lists models (authenticated, no token spend) and remembers a
+        successful check. The chat-completion probe is only used when the
+        models endpoint is unavailable.
+        """
+        if self._connection_verified:
+            return True
+        try:
+            self.client.models.list(timeout=5)
+            self._connection_verified = True
+        except NotFoundError:
+            self._connection_verified = self._probe_completion()
+        except Exception:
+            return False
+        return self._connection_verified
+
+    def _probe_completion(self) -> bool:
+        """Verify connectivity with a minimal deterministic completion."""
         try:
             response = self.call_completion(
                 prompt="Return a simple JSON object: {\"test\": \"success\"}",
@@ -1,13 +1,34 @@
 #!/usr/bin/env python3
 """Demonstration of CCN architecture without actual API calls."""
 
-import json
+import asyncio
+import re
 from datetime import datetime
+from operator import itemgetter
 from mini_memory import MEMORY, SynapticKVList, MaterializedRole, PerRoleRecord, CCNEvent
 from mini_synaptic import NodeTemplates, SynapticParser
 
+_ROLE_RE = re.compile(r'ROLE:\s*([A-Za-z_]+)\.')
+
 class MockLLMClient:
     """Mock LLM client for demonstration."""
+
+    # Predetermined responses keyed by the role id in the prompt header
+    _RESPONSES = {
+        "REFORMULATOR": {"reformulated_question": "What are the fundamental principles and applications of machine learning in modern computing?"},
+        "ELUCIDATOR": {
+            "tasks": [
+                ["task 1", "ROLE: DEFINITION_EXPERT. Define machine learning concepts and terminology. RESPONSE_JSON: {\"node_output_signal\": \"<definition>\"}"],
+                ["task 2", "ROLE: APPLICATION_ANALYST. Analyze real-world ML applications. RESPONSE_JSON: {\"node_output_signal\": \"<applications>\"}"],
+                ["task 3", "ROLE: TECHNOLOGY_REVIEWER. Review current ML technologies. RESPONSE_JSON: {\"node_output_signal\": \"<technologies>\"}"],
+                ["task 4", "ROLE: SYNTHESIZER. Synthesize all information into comprehensive overview. RESPONSE_JSON: {\"node_output_signal\": \"<synthesis>\"}"]
+            ]
+        },
+        "DEFINITION_EXPERT": {"node_output_signal": "Machine learning is a subset of artificial intelligence that enables systems to learn and improve from experience without being explicitly programmed. It focuses on developing algorithms that can analyze data, identify patterns, and make decisions with minimal human intervention."},
+        "APPLICATION_ANALYST": {"node_output_signal": "Machine learning applications span numerous domains: healthcare (diagnostic imaging, drug discovery), finance (fraud detection, algorithmic trading), transportation (autonomous vehicles, route optimization), entertainment (recommendation systems, content generation), and business (customer analytics, supply chain optimization)."},
+        "TECHNOLOGY_REVIEWER": {"node_output_signal": "Current ML technologies include deep learning frameworks (TensorFlow, PyTorch), natural language processing models (GPT, BERT), computer vision systems (CNNs, transformers), reinforcement learning platforms, and specialized hardware (GPUs, TPUs). Emerging trends focus on explainable AI, federated learning, and edge computing."},
+        "SYNTHESIZER": {"node_output_signal": "Machine learning represents a transformative field of artificial intelligence that enables systems to learn from data without explicit programming. Its core principles involve pattern recognition, statistical modeling, and iterative improvement. The technology has revolutionized numerous industries through applications in healthcare diagnostics, financial analysis, autonomous systems, and personalized recommendations. Current technologies leverage deep learning frameworks and specialized hardware, with emerging trends focusing on explainable AI and edge computing. ML's continued evolution promises even greater integration into daily life and business operations."},
+    }
     
     def __init__(self):
         self.call_count = 0
@@ -16,31 +37,27 @@ class MockLLMClient:
         """Mock LLM call that returns predetermined responses."""
         self.call_count += 1
         
-        # Determine response based on prompt content
-        if "REFORMULATOR" in prompt:
-            return {"reformulated_question": "What are the fundamental principles and applications of machine learning in modern computing?"}
-        elif "ELUCIDATOR" in prompt:
-            return {
-                "tasks": [
-                    ["task 1", "ROLE: DEFINITION_EXPERT. Define machine learning concepts and terminology. RESPONSE_JSON: {\"node_output_signal\": \"<definition>\"}"],
-                    ["task 2", "ROLE: APPLICATION_ANALYST. Analyze real-world ML applications. RESPONSE_JSON: {\"node_output_signal\": \"<applications>\"}"],
-                    ["task 3", "ROLE: TECHNOLOGY_REVIEWER. Review current ML technologies. RESPONSE_JSON: {\"node_output_signal\": \"<technologies>\"}"],
-                    ["task 4", "ROLE: SYNTHESIZER. Synthesize all information into comprehensive overview. RESPONSE_JSON: {\"node_output_signal\": \"<synthesis>\"}"]
-                ]
-            }
-        elif "DEFINITION_EXPERT" in prompt:
-            return {"node_output_signal": "Machine learning is a subset of artificial intelligence that enables systems to learn and improve from experience without being explicitly programmed. It focuses on developing algorithms that can analyze data, identify patterns, and make decisions with minimal human intervention."}
-        elif "APPLICATION_ANALYST" in prompt:
-            return {"node_output_signal": "Machine learning applications span numerous domains: healthcare (diagnostic imaging, drug discovery), finance (fraud detection, algorithmic trading), transportation (autonomous vehicles, route optimization), entertainment (recommendation systems, content generation), and business (customer analytics, supply chain optimization)."}
-        elif "TECHNOLOGY_REVIEWER" in prompt:
-            return {"node_output_signal": "Current ML technologies include deep learning frameworks (TensorFlow, PyTorch), natural language processing models (GPT, BERT), computer vision systems (CNNs, transformers), reinforcement learning platforms, and specialized hardware (GPUs, TPUs). Emerging trends focus on explainable AI, federated learning, and edge computing."}
-        elif "SYNTHESIZER" in prompt:
-            return {"node_output_signal": "Machine learning represents a transformative field of artificial intelligence that enables systems to learn from data without explicit programming. Its core principles involve pattern recognition, statistical modeling, and iterative improvement. The technology has revolutionized numerous industries through applications in healthcare diagnostics, financial analysis, autonomous systems, and personalized recommendations. Current technologies leverage deep learning frameworks and specialized hardware, with emerging trends focusing on explainable AI and edge computing. ML's continued evolution promises even greater integration into daily life and business operations."}
-        else:
+        # MockWorkerNode prompts always start with "Role: <ROLE_ID>"
+        role_id = prompt.split("\n", 1)[0][len("Role: "):]
+        response = self._RESPONSES.get(role_id)
+        if response is None:
             return {"node_output_signal": f"Mock response for role {self.call_count}"}
+        return response
+
+    async def acall_completion(self, prompt: str, **kwargs) -> dict:
+        """Awaitable mock call; yields to the loop like a network round-trip."""
+        await asyncio.sleep(0)
+        return self.call_completion(prompt, **kwargs)
 
 class MockWorkerNode:
     """Mock worker node for demonstration."""
+
+    # Response field per role type; worker roles and SYNTHESIZER use the default
+    _RESPONSE_EXTRACTORS = {
+        'REFORMULATOR': itemgetter('reformulated_question'),
+        'ELUCIDATOR': itemgetter('tasks'),
+    }
+    _DEFAULT_EXTRACTOR = itemgetter('node_output_signal')
     
     def __init__(self, llm_client):
         self.llm_client = llm_client
@@ -55,20 +72,32 @@ class MockWorkerNode:
         response = self.llm_client.call_completion(prompt)
         
         # Process response based on role type
-        if role.node_id == 'REFORMULATOR':
-            return response['reformulated_question']
-        elif role.node_id == 'ELUCIDATOR':
-            return response['tasks']
-        else:
-            return response['node_output_signal']
+        return self._RESPONSE_EXTRACTORS.get(role.node_id, self._DEFAULT_EXTRACTOR)(response)
+
+    async def aexecute_role(self, role: MaterializedRole):
+        """Execute worker role with the awaitable mock LLM."""
+        prompt = self.build_prompt(role)
+        response = await self.llm_client.acall_completion(prompt)
+        return self._RESPONSE_EXTRACTORS.get(role.node_id, self._DEFAULT_EXTRACTOR)(response)
 
 class MockCCN:
     """Mock CCN orchestrator for demonstration."""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
         self.memory = MEMORY()
         self.llm_client = MockLLMClient()
         self.worker_node = MockWorkerNode(self.llm_client)
+        self.max_concurrency = max_concurrency
+
+    async def _run_workers(self, worker_roles):
+        """Fan out independent worker roles, bounded by max_concurrency."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(role):
+            async with semaphore:
+                return await self.worker_node.aexecute_role(role)
+
+        return await asyncio.gather(*[run(role) for role in worker_roles])
     
     def execute(self, user_input: str) -> str:
         """Execute complete CCN cycle with mock responses."""
@@ -118,36 +147,36 @@ class MockCCN:
         # Phase 3: Worker Roles
         print("\n⚙️  Phase 3: Worker Roles")
         print("-" * 30)
-        worker_results = []
-        
+        worker_roles = []
         for i, task in enumerate(tasks[:-1]):  # Exclude SYNTHESIZER task
             if isinstance(task, list) and len(task) >= 2:
-                task_text = task[1]
-                role_name = f"WORKER_{i+1}"
-                
-                # Create worker role
-                worker_synaptic = NodeTemplates.create_worker_role(
-                    task_text, reformulated, role_name, i
-                )
+                task_text = str(task[1])
+                # Same "ROLE: <NAME>." declaration MiniCCN parses
+                match = _ROLE_RE.search(task_text)
+                role_name = match.group(1).upper() if match else f"WORKER_{i+1}"
+                worker_synaptic = NodeTemplates.create_worker_role(role_name, i + 1)
                 worker_role = SynapticParser.materialize_role(worker_synaptic)
-                
-                result = self.worker_node.execute_role(worker_role)
-                worker_results.append(result)
-                
-                print(f"✅ {role_name}: {result[:100]}...")
-                
-                # Archive worker result
-                record = PerRoleRecord(
-                    node_id=worker_role.node_id,
-                    entry_id=worker_role.entry_id,
-                    input_signals=worker_role.input_signals,
-                    node_output_signal=result,
-                    tasks=worker_role.tasks
-                )
-                self.memory.add_to_archive(record)
-                
-                # Add to aggregator buffer
-                self.memory.add_to_aggregator(result)
+                worker_role.input_signals = [task_text]
+                worker_roles.append(worker_role)
+
+        # Workers are independent: overlap their LLM calls, then record in order
+        worker_results = asyncio.run(self._run_workers(worker_roles))
+
+        for worker_role, result in zip(worker_roles, worker_results):
+            print(f"✅ {worker_role.node_id}: {result[:100]}...")
+
+            # Archive worker result
+            record = PerRoleRecord(
+                node_id=worker_role.node_id,
+                entry_id=worker_role.entry_id,
+                input_signals=worker_role.input_signals,
+                node_output_signal=result,
+                tasks=worker_role.tasks
+            )
+            self.memory.add_to_archive(record)
+
+            # Add to aggregator buffer
+            self.memory.add_to_aggregator(result)
         
         # Phase 4: SYNTHESIZER
         print("\n🎯 Phase 4: SYNTHESIZER")
@@ -155,8 +184,9 @@ class MockCCN:
         synaptic_list = NodeTemplates.create_synthesizer()
         role = SynapticParser.materialize_role(synaptic_list)
         
-        # Provide aggregator buffer as input
-        role.input_signals = [json.dumps(self.memory.aggregator_buffer, indent=2)]
+        # Provide aggregator buffer as input: one signal per worker output, as
+        # MiniCCN binds it, so no JSON encode/decode round-trip is needed
+        role.input_signals = list(self.memory.aggregator_buffer)
         
         final_result = self.worker_node.execute_role(role)
         print(f"✅ Final synthesis completed!")
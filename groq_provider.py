@@ -2,24 +2,113 @@
 
 from __future__ import annotations
 
-import os
+import atexit
+import io
+import threading
 from typing import Any, Dict, Optional
 
-from groq import Groq
+import httpx
+import orjson
+from groq import AsyncGroq, Groq
 
-from llm_providers import LLMProvider
+from llm_providers import _ENV_SNAPSHOT, LLMProvider, register
 
+# One keep-alive HTTP/2 pool shared by every Groq client in the process, so
+# the REFORMULATOR -> ELUCIDATOR -> workers -> SYNTHESIZER calls reuse warm
+# TCP/TLS connections instead of handshaking per client.
+_SHARED_HTTP = httpx.Client(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+)
+atexit.register(_SHARED_HTTP.close)
 
+
+def _async_http() -> httpx.AsyncClient:
+    """Return an HTTP/2 pool for one provider's async client.
+
+    Concurrent worker calls are multiplexed over a few warm connections. Async
+    pools bind to the event loop that first uses them, so unlike _SHARED_HTTP
+    they are not shared process-wide.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+# Sync Groq clients keyed by API key, so every provider instance shares one
+_GROQ_CLIENTS: Dict[str, Groq] = {}
+_GROQ_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_groq(api_key: str) -> Groq:
+    """Return the process-wide Groq client for `api_key`, creating it once."""
+    with _GROQ_CLIENTS_LOCK:
+        client = _GROQ_CLIENTS.get(api_key)
+        if client is None:
+            client = _GROQ_CLIENTS[api_key] = Groq(api_key=api_key, http_client=_SHARED_HTTP)
+        return client
+
+
+@register("groq")
 class GroqProvider(LLMProvider):
     """Groq API provider implementation."""
 
+    __slots__ = ("client", "aclient", "_last_raw_response")
+
     def __init__(self, api_key: str):
         """Initialize Groq provider."""
         super().__init__(api_key)
-        self.client = Groq(api_key=api_key)
+        self.client = _get_groq(api_key)
+        self.aclient = AsyncGroq(api_key=api_key, http_client=_async_http())
         self._last_raw_response: Optional[str] = None
 
     def call_completion(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        reasoning_effort: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """Make a chat completion call using Groq API.
+
+        With ``stream=True`` the body is accumulated chunk by chunk while it
+        arrives, so only a single parse is left once the stream closes.
+        """
+        # A one-element tuple is the cheapest iterable the SDK will serialize
+        messages = ({"role": "user", "content": prompt},)
+
+        if stream:
+            # Groq uses max_completion_tokens instead of max_tokens
+            completion = self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_completion_tokens=max_tokens,
+                response_format=response_format,
+                stream=True
+            )
+            buf = io.StringIO()
+            for chunk in completion:
+                if chunk.choices:
+                    buf.write(chunk.choices[0].delta.content or "")
+            return self._handle_content(buf.getvalue(), response_format)
+
+        raw = self.client.chat.completions.with_raw_response.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_completion_tokens=max_tokens,
+            response_format=response_format
+        )
+
+        return self._handle_content(self._content_from_body(raw.read()), response_format)
+
+    async def acall_completion(
         self,
         prompt: str,
         model: str,
@@ -28,11 +117,11 @@ class GroqProvider(LLMProvider):
         reasoning_effort: Optional[str] = None,
         response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make a chat completion call using Groq API."""
-        messages = [{"role": "user", "content": prompt}]
+        """Awaitable chat completion using the async Groq client."""
+        # A one-element tuple is the cheapest iterable the SDK will serialize
+        messages = ({"role": "user", "content": prompt},)
 
-        # Groq uses max_completion_tokens instead of max_tokens
-        completion = self.client.chat.completions.create(
+        raw = await self.aclient.chat.completions.with_raw_response.create(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -40,19 +129,38 @@ class GroqProvider(LLMProvider):
             response_format=response_format
         )
 
-        content = completion.choices[0].message.content
+        return self._handle_content(self._content_from_body(await raw.read()), response_format)
+
+    @staticmethod
+    def _content_from_body(body: bytes) -> str:
+        """Pull the message text out of a raw completion body.
+
+        Only one field is needed, so the body is decoded with orjson instead of
+        being validated into the SDK's pydantic ChatCompletion model.
+        """
+        return orjson.loads(body)["choices"][0]["message"]["content"]
+
+    def _handle_content(
+        self,
+        content: str,
+        response_format: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Record the raw body and parse it according to the response format."""
         self._last_raw_response = content
 
         # Handle JSON response
         if response_format and response_format.get("type") == "json_object":
-            import json
             try:
-                return json.loads(content)
-            except json.JSONDecodeError as e:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Failed to parse JSON response: {e}\nContent: {content}")
 
         return {"content": content}
 
+    async def aclose(self) -> None:
+        """Close the async client's connection pool."""
+        await self.aclient.close()
+
     def get_provider_name(self) -> str:
         """Return provider name."""
         return "groq"
@@ -64,22 +172,20 @@ class GroqProvider(LLMProvider):
     @classmethod
     def get_api_key_from_env(cls) -> str:
         """Get API key from environment variable."""
-        api_key = os.environ.get("GROQ_API_KEY")
+        api_key = _ENV_SNAPSHOT["GROQ_API_KEY"]
         if not api_key:
             raise ValueError("GROQ_API_KEY environment variable is required")
         return api_key
 
     def test_connection(self) -> bool:
-        """Test basic connectivity to Groq API."""
+        """Test basic connectivity to Groq API.
+
+        Lists models: same authentication as a completion, but no tokens
+        are spent and the round-trip is a single small GET.
+        """
         try:
-            response = self.call_completion(
-                prompt="Return a simple JSON object: {\"test\": \"success\"}",
-                model="openai/gpt-oss-120b",  # Use a known working model
-                temperature=0.0,
-                max_tokens=100,
-                response_format={"type": "json_object"}
-            )
-            return "test" in response and response["test"] == "success"
+            self.client.models.list(timeout=5)
+            return True
         except Exception:
             return False
 
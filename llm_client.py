@@ -1,11 +1,11 @@
 """LLM client wrapper supporting multiple providers (Groq, DeepSeek, etc.)."""
 
-import os
-import json
-from typing import Any, Dict, Optional
-
-# Remove hardcoded groq import - now handled by providers
-# from groq import Groq
+import asyncio
+import copy
+import hashlib
+import string
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from llm_providers import LLMProvider, create_provider
 
@@ -15,9 +15,62 @@ class LLMError(Exception):
     pass
 
 
+_MISSING_PARAMS_MSG = "LLM parameters missing: model/temperature/max_tokens must be set via templates"
+_MISSING_RF_MSG = "response_format must be set via templates (e.g., json_object)"
+
+
+_JSON_STR_TOKENS = frozenset({"json_object", "JSON_OBJECT", "Json_Object"})
+
+
+def _canonical_rf(rf: Any) -> Any:
+    """Canonicalize a response_format selector into the dict the providers expect.
+
+    Templates already store the dict form, so this is a single type check on
+    the hot path; only the "json_object" shorthand is rewritten.
+    """
+    if type(rf) is dict:
+        return rf
+    # Common spellings resolve with one hash lookup; others fall back to lower()
+    if isinstance(rf, str) and (rf in _JSON_STR_TOKENS or rf.lower() == "json_object"):
+        return {"type": "json_object"}
+    return rf
+
+
+class CompiledPrompt:
+    """Prompt template parsed once into (literal, field) pairs.
+
+    Accepts `str.format` syntax with plain field names, e.g.
+    ``CompiledPrompt("Role: {role}\nInputs: {inputs}")``.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, template: str):
+        parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in prompt field '{field}'")
+            parts.append((literal, field))
+        self._parts = tuple(parts)
+
+    def render(self, **kw: Any) -> str:
+        """Substitute variables without re-parsing the template."""
+        out = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(kw[field]))
+        return "".join(out)
+
+
 class LLMClient:
     """Wrapper for LLM API clients supporting multiple providers."""
 
+    __slots__ = ("provider", "_cache", "_cached_raw")
+
+    # Max number of deterministic (temperature == 0) completions kept in memory
+    CACHE_SIZE = 128
+
     def __init__(self, provider: Optional[LLMProvider] = None, provider_name: str = "groq", api_key: Optional[str] = None):
         """Initialize LLM client with specified provider.
 
@@ -31,7 +84,44 @@ class LLMClient:
         else:
             # Create provider using factory function
             self.provider = create_provider(provider_name, api_key)
+
+        # Content-addressed LRU of deterministic completions (digest -> (raw body, result))
+        self._cache: "OrderedDict[bytes, Tuple[Optional[str], Dict[str, Any]]]" = OrderedDict()
+        # Raw body of the last call when it was served from the cache; None
+        # when the provider answered and holds the body itself
+        self._cached_raw: Optional[str] = None
+
+    @staticmethod
+    def _cache_key(
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        reasoning_effort: str,
+        response_format: Any
+    ) -> bytes:
+        """Digest the prompt together with every parameter that shapes the answer."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{model}|{temperature}|{max_tokens}|{reasoning_effort}|{response_format!r}".encode())
+        h.update(b"\0")
+        h.update(prompt.encode())
+        return h.digest()
     
+    @staticmethod
+    def _check_params(
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        response_format: Optional[Any]
+    ) -> Dict[str, Any]:
+        """Require template-provided parameters and normalize response_format."""
+        # Require all parameters (single source of truth in templates)
+        if model is None or temperature is None or max_tokens is None:
+            raise LLMError(_MISSING_PARAMS_MSG)
+        if response_format is None:
+            raise LLMError(_MISSING_RF_MSG)
+        return _canonical_rf(response_format)
+
     def call_completion(
         self,
         prompt: str,
@@ -39,20 +129,75 @@ class LLMClient:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         reasoning_effort: str = "low",
-        response_format: Optional[Dict[str, Any]] = None
+        response_format: Optional[Dict[str, Any]] = None,
+        stream: bool = False
     ) -> Dict[str, Any]:
-        """Call LLM completion using the configured provider."""
-        # Require all parameters (single source of truth in templates)
-        if model is None or temperature is None or max_tokens is None:
-            raise LLMError("LLM parameters missing: model/temperature/max_tokens must be set via templates")
-        if response_format is None:
-            raise LLMError("response_format must be set via templates (e.g., json_object)")
-        if isinstance(response_format, str) and response_format.lower() == "json_object":
-            response_format = {"type": "json_object"}
+        """Call LLM completion using the configured provider.
+
+        ``stream=True`` asks a streaming-capable provider (Groq) to receive the
+        body incrementally; the returned result is the same.
+        """
+        response_format = self._check_params(model, temperature, max_tokens, response_format)
+
+        # Only deterministic calls are memoized; sampled ones must stay fresh
+        key = None
+        if temperature <= 0:
+            key = self._cache_key(prompt, model, temperature, max_tokens, reasoning_effort, response_format)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cached_raw, result = cached
+                return copy.deepcopy(result)
+
+        self._cached_raw = None
 
         try:
             # Delegate to provider
-            return self.provider.call_completion(
+            result = self.provider.call_completion(
+                prompt=prompt,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                reasoning_effort=reasoning_effort,
+                response_format=response_format,
+                # Only forwarded when requested; not every provider accepts it
+                **({"stream": True} if stream else {})
+            )
+
+        except LLMError:
+            raise
+        except Exception as e:
+            raise LLMError(f"LLM call failed: {e}") from e
+
+        if key is not None:
+            self._cache[key] = (self.provider.last_raw_response, copy.deepcopy(result))
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def call_template(self, cp: CompiledPrompt, vars: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        """Render a pre-compiled prompt and call the provider with it."""
+        try:
+            prompt = cp.render(**vars)
+        except KeyError as e:
+            raise LLMError(f"Prompt variable missing: {e}") from e
+        return self.call_completion(prompt, **params)
+
+    async def acall_completion(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        reasoning_effort: str = "low",
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Awaitable counterpart of `call_completion` for concurrent callers."""
+        response_format = self._check_params(model, temperature, max_tokens, response_format)
+        self._cached_raw = None
+
+        try:
+            return await self.provider.acall_completion(
                 prompt=prompt,
                 model=model,
                 temperature=temperature,
@@ -61,12 +206,30 @@ class LLMClient:
                 response_format=response_format
             )
 
+        except LLMError:
+            raise
         except Exception as e:
-            raise LLMError(f"LLM call failed: {str(e)}")
+            raise LLMError(f"LLM call failed: {e}") from e
+
+    async def acall_many(self, prompts: List[str], **params: Any) -> List[Dict[str, Any]]:
+        """Run independent completions concurrently; results follow `prompts` order.
+
+        Example:
+            results = asyncio.run(client.acall_many(worker_prompts, **params))
+        """
+        return await asyncio.gather(
+            *[self.acall_completion(prompt, **params) for prompt in prompts]
+        )
+
+    async def aclose(self) -> None:
+        """Close the provider's async connection pool."""
+        await self.provider.aclose()
 
     @property
     def last_raw_response(self) -> Optional[str]:
-        """Return raw content from the most recent LLM call."""
+        """Return raw content from the most recent LLM call, including cache hits."""
+        if self._cached_raw is not None:
+            return self._cached_raw
         return self.provider.last_raw_response
 
     def test_connection(self) -> bool:
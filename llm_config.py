@@ -6,9 +6,11 @@ environment overrides, and a merger utility for per-role overrides.
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 
 @dataclass(frozen=True)
@@ -20,15 +22,23 @@ class LLMDefaults:
     # Keep in structure for compatibility; not all models support it and the
     # client does not currently forward it to the API call.
     reasoning_effort: str = "medium"
-    response_format: Dict[str, Any] = None  # set via factory below
+    response_format: Dict[str, Any] = None  # filled from _JSON_OBJECT_RF below
 
 
-def _default_response_format() -> Dict[str, Any]:
-    return {"type": "json_object"}
+# Shared read-only default; copy with dict() wherever a mutable one is needed
+_JSON_OBJECT_RF = MappingProxyType({"type": "json_object"})
 
+# Keys a per-role override may set
+_ALLOWED_OVERRIDE_KEYS = frozenset({
+    "provider", "model", "temperature", "max_tokens", "reasoning_effort", "response_format"
+})
+
+# LLMDefaults is frozen, so its field reflection only has to happen once
+_BASE_DICT = asdict(LLMDefaults())
 
-def get_default_llm_config() -> Dict[str, Any]:
-    """Return default config merged with environment overrides.
+
+def _compute_default_llm_config() -> Dict[str, Any]:
+    """Build default config merged with environment overrides.
 
     Environment overrides (optional):
       - EPN_LLM_PROVIDER ('groq' or 'deepseek')
@@ -38,7 +48,7 @@ def get_default_llm_config() -> Dict[str, Any]:
       - EPN_LLM_REASONING_EFFORT
       - EPN_LLM_RESPONSE_FORMAT ("json_object" currently supported)
     """
-    base = asdict(LLMDefaults(response_format=_default_response_format()))
+    base = _BASE_DICT.copy()
 
     # Provider override
     env_provider = os.getenv("EPN_LLM_PROVIDER")
@@ -71,15 +81,37 @@ def get_default_llm_config() -> Dict[str, Any]:
     if env_rf:
         # Support simple selector for now
         if env_rf.lower() == "json_object":
-            base["response_format"] = _default_response_format()
+            base["response_format"] = _JSON_OBJECT_RF
 
-    # Ensure response_format exists
-    if not isinstance(base.get("response_format"), dict):
-        base["response_format"] = _default_response_format()
+    # Ensure response_format exists; get_default_llm_config() copies it out
+    if not isinstance(base.get("response_format"), Mapping):
+        base["response_format"] = _JSON_OBJECT_RF
 
     return base
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_default_llm_config() -> MappingProxyType:
+    # Environment is read once per process; see clear_default_llm_config_cache()
+    return MappingProxyType(_compute_default_llm_config())
+
+
+def get_default_llm_config() -> Dict[str, Any]:
+    """Return a fresh, mutable copy of the cached default config.
+
+    Callers (roles, bind_inputs) mutate the result, so the cached snapshot
+    itself is never handed out.
+    """
+    base = dict(_cached_default_llm_config())
+    base["response_format"] = dict(base["response_format"])
+    return base
+
+
+def clear_default_llm_config_cache() -> None:
+    """Drop the cached defaults so the next call re-reads EPN_LLM_* overrides."""
+    _cached_default_llm_config.cache_clear()
+
+
 def merge_llm_config(overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """Merge defaults (with env overrides) and provided per-role overrides.
 
@@ -87,11 +119,9 @@ def merge_llm_config(overrides: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """
     merged = get_default_llm_config()
     if overrides:
-        for k, v in overrides.items():
-            # Only accept known keys
-            if k in {"provider", "model", "temperature", "max_tokens", "reasoning_effort", "response_format"}:
-                merged[k] = v
+        # Only accept known keys
+        merged.update((k, v) for k, v in overrides.items() if k in _ALLOWED_OVERRIDE_KEYS)
     # Guarantee response_format present
     if not isinstance(merged.get("response_format"), dict):
-        merged["response_format"] = _default_response_format()
+        merged["response_format"] = dict(_JSON_OBJECT_RF)
     return merged
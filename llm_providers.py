@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
+import importlib
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Type
+
+# Provider API keys captured once at import; every provider instance reads the
+# same values even if the environment changes mid-run
+_ENV_KEYS = ("GROQ_API_KEY", "DEEPSEEK_API_KEY")
+_env_values: Dict[str, Optional[str]] = {k: os.environ.get(k) for k in _ENV_KEYS}
+_ENV_SNAPSHOT = MappingProxyType(_env_values)
+
+
+def refresh_env_snapshot() -> None:
+    """Re-read provider API keys from the environment (e.g. in tests)."""
+    _env_values.update((k, os.environ.get(k)) for k in _ENV_KEYS)
+
+# Provider classes by name, filled by @register when a provider module loads
+_PROVIDER_REGISTRY: Dict[str, Type["LLMProvider"]] = {}
+
+# Module defining each built-in provider; imported only when first requested so
+# an app using one provider never pays for the other SDK
+_PROVIDER_MODULES = {
+    "groq": "groq_provider",
+    "deepseek": "deepseek_provider",
+}
+
+
+def register(name: str) -> Callable[[Type["LLMProvider"]], Type["LLMProvider"]]:
+    """Class decorator adding a provider to the registry under `name`."""
+    def decorator(cls: Type["LLMProvider"]) -> Type["LLMProvider"]:
+        _PROVIDER_REGISTRY[name] = cls
+        return cls
+    return decorator
 
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers (Groq, DeepSeek, etc.)."""
 
+    __slots__ = ("api_key",)
+
     def __init__(self, api_key: str):
         """Initialize provider with API key."""
         self.api_key = api_key
@@ -41,6 +75,34 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def acall_completion(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        reasoning_effort: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Awaitable chat completion used for concurrent fan-out.
+
+        Providers with a native async SDK should override this. The default
+        runs the blocking `call_completion` inline: calls from a sync-only
+        provider do not overlap, but `last_raw_response` stays attributable
+        to the caller that just resumed (worker threads would race on it).
+        """
+        return self.call_completion(
+            prompt=prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            reasoning_effort=reasoning_effort,
+            response_format=response_format
+        )
+
+    async def aclose(self) -> None:
+        """Release async connection resources; call on the loop that used them."""
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Return the provider name (e.g., 'groq', 'deepseek')."""
@@ -77,15 +139,14 @@ def create_provider(provider_name: str, api_key: Optional[str] = None) -> LLMPro
         ValueError: If provider_name is not supported
         ValueError: If api_key is not provided and env var is missing
     """
-    if provider_name.lower() == "groq":
-        from groq_provider import GroqProvider
-        if api_key is None:
-            api_key = GroqProvider.get_api_key_from_env()
-        return GroqProvider(api_key)
-    elif provider_name.lower() == "deepseek":
-        from deepseek_provider import DeepSeekProvider
-        if api_key is None:
-            api_key = DeepSeekProvider.get_api_key_from_env()
-        return DeepSeekProvider(api_key)
-    else:
-        raise ValueError(f"Unsupported provider: {provider_name}. Supported: groq, deepseek")
\ No newline at end of file
+    name = provider_name.lower()
+    provider_cls = _PROVIDER_REGISTRY.get(name)
+    if provider_cls is None and name in _PROVIDER_MODULES:
+        importlib.import_module(_PROVIDER_MODULES[name])
+        provider_cls = _PROVIDER_REGISTRY.get(name)
+    if provider_cls is None:
+        raise ValueError(f"Unsupported provider: {provider_name}. Supported: groq, deepseek")
+
+    if api_key is None:
+        api_key = provider_cls.get_api_key_from_env()
+    return provider_cls(api_key)
\ No newline at end of file
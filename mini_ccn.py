@@ -1,8 +1,17 @@
 """CCN orchestrator with execution loop and MEMORY management."""
 
-import json
-from collections import deque
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import functools
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple
+
+import orjson
+
 from mini_memory import MEMORY, MaterializedRole, PerRoleRecord, CCNEvent, SynapticKVList
 from mini_synaptic import SynapticParser, NodeTemplates, ValidationError
 from worker_node import WorkerNode
@@ -10,6 +19,44 @@ from template_loader import repo as template_repo
 from llm_client import LLMError
 
 
+# "... ROLE: <NAME>. <description>" as emitted by ELUCIDATOR, matched in one pass
+_TASK_ENTRY_RE = re.compile(r'ROLE:\s*(?P<name>[^.]*)(?P<dot>\.)?(?P<desc>.*)', re.DOTALL)
+
+
+# Plan every built-in role runs when its template sets none; a tuple, so all
+# roles can share it
+_DEFAULT_CALL_PLAN = ('prompt_call', 'emit')
+
+def _copy_llm_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a role's llm_config; only response_format is nested, so no deepcopy."""
+    copied = dict(config)
+    response_format = copied.get('response_format')
+    if isinstance(response_format, dict):
+        copied['response_format'] = dict(response_format)
+    return copied
+
+
+# Worklist placeholders are only read (node_id) once enqueued, so identical
+# entries are built once and shared across runs
+_worker_entry = functools.lru_cache(maxsize=256)(NodeTemplates.create_worker_role)
+_synthesizer_entry = functools.lru_cache(maxsize=1)(NodeTemplates.create_synthesizer)
+
+
+class _Metrics:
+    """Per-execution counters; attribute increments avoid dict lookups."""
+
+    __slots__ = ('roles_processed', 'enqueued_roles', 'aggregator_appends',
+                 'llm_errors', 'parse_errors')
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Counters keyed by name, in declaration order."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class CCNError(Exception):
     """Raised when CCN orchestration fails."""
     pass
@@ -25,35 +72,199 @@ class MiniCCN:
     behavior.
     """
 
+    # Builders for the built-in role skeletons (see _role_from_skeleton)
+    _SKELETON_TEMPLATES = {
+        'REFORMULATOR': lambda: NodeTemplates.create_reformulator(''),
+        'ELUCIDATOR': lambda: NodeTemplates.create_elucidator(''),
+        'WORKER': lambda: NodeTemplates.create_worker_role('WORKER', 0),
+        'SYNTHESIZER': NodeTemplates.create_synthesizer,
+    }
+
+    # Max number of worker results kept for deduplication
+    ROLE_CACHE_SIZE = 256
+
     def __init__(
         self,
         worker_node: WorkerNode,
         debug: bool = False,
         dispatch_in_ccn: bool = False,
+        max_inflight: int = 8,
+        archive_mode: Literal['full', 'final', 'off'] = 'full',
     ):
-        """Initialize CCN with worker node and debug/dispatch flags."""
+        """Initialize CCN with worker node and debug/dispatch flags.
+
+        `max_inflight` caps concurrent worker LLM calls so fan-out stays
+        within the provider's rate limits. `archive_mode` selects which
+        PerRoleRecords are kept: every role ('full'), only the SYNTHESIZER
+        record without its input signals ('final'), or none ('off').
+        """
+        if archive_mode not in ('full', 'final', 'off'):
+            raise ValueError(f"Unknown archive_mode: {archive_mode}")
+        if max_inflight < 1:
+            raise ValueError(f"max_inflight must be at least 1, got {max_inflight}")
         self.memory = MEMORY()
         self.worker_node = worker_node
-        self.worker_node.set_event_sink(self.memory.log_event)
+        # Orchestrator and worker events as (event_type, node_id, timestamp_ns, data) tuples,
+        # moved into the run log's columns in one pass at flush points
+        self._event_batch: List[Tuple[str, Optional[str], int, Dict[str, Any]]] = []
+        self.worker_node.set_event_sink(self._log_worker_event)
         self.debug = debug
         self.dispatch_in_ccn = dispatch_in_ccn
-        self.pending_worker_specs = deque()
+        self.archive_mode = archive_mode
+        # (worker synaptic, spec) pairs enqueued by the last ELUCIDATOR run
+        self._worker_pairs: List[Tuple[SynapticKVList, Dict[str, Any]]] = []
         self.synthesizer_spec: Optional[Dict[str, Any]] = None
         self.reformulated_question: Optional[str] = None
-        self.metrics: Dict[str, int] = {
-            'roles_processed': 0,
-            'enqueued_roles': 0,
-            'aggregator_appends': 0,
-            'llm_errors': 0,
-            'parse_errors': 0
+        # Event loop for concurrent worker fan-out; kept across execute() calls
+        # because async SDK connection pools bind to the loop that first uses them
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.max_inflight = max_inflight
+        # Shared by every fan-out on the loop above, across execute() calls
+        self._llm_sem = asyncio.Semaphore(max_inflight)
+        # Worker results (or in-flight calls) keyed by role content and LLM
+        # params, so identical subtasks within one run share one LLM call;
+        # cleared by execute() so sampled outputs are never replayed
+        self._role_cache: "OrderedDict[bytes, asyncio.Future]" = OrderedDict()
+        # SYNTHESIZER input strings, kept parallel to memory.aggregator_buffer
+        # and serialized as each worker finishes rather than at binding time
+        self._aggregator_signals: List[str] = []
+        # bind_inputs handlers keyed by (source role, target role or 'WORKER')
+        self._bind_table: Dict[Tuple[str, str], Callable[[MaterializedRole, Any], None]] = {
+            ('USER', 'REFORMULATOR'): self._bind_text_input,
+            ('REFORMULATOR', 'ELUCIDATOR'): self._bind_text_input,
+            ('ELUCIDATOR', 'WORKER'): self._bind_worker_spec,
+            ('ELUCIDATOR', 'SYNTHESIZER'): self._bind_synthesizer,
         }
+        # (node_id, wall time in ns) per successful role in the current
+        # execute(); concurrent workers are listed in spec order
+        self.role_timings: List[Tuple[str, int]] = []
+        self.metrics = _Metrics()
+        # Materialized built-in roles, validated once per instance and cloned
+        # per use; every per-run field is then set by bind_inputs. Per instance
+        # so each MiniCCN snapshots the defaults in effect when it runs.
+        self._role_skeletons: Dict[str, MaterializedRole] = {}
     
     def log_debug(self, message: str, data: Optional[Dict[str, Any]] = None) -> None:
-        """Log debug message if debug mode is enabled."""
-        if self.debug:
-            print(f"[DEBUG] {message}")
-            if data:
-                print(f"  Data: {json.dumps(data, indent=2)[:500]}...")
+        """Log debug message if debug mode is enabled.
+
+        Callers formatting a message check `self.debug` first, so the
+        f-string is not built when debug output is off.
+        """
+        if not self.debug:
+            return
+        print(f"[DEBUG] {message}")
+        if data:
+            # Compact JSON: only the first 500 characters are shown, so
+            # indentation would just spend that budget on whitespace
+            print(f"  Data: {orjson.dumps(data).decode()[:500]}...")
+
+    def _log(self, event_type: str, node_id: Optional[str], data: Dict[str, Any]) -> None:
+        """Queue an orchestrator event; timestamped now, materialized on flush."""
+        self._event_batch.append((event_type, node_id, time.time_ns(), data))
+
+    def _flush_events(self) -> None:
+        """Move queued orchestrator and worker events into memory.run_log, in order."""
+        if self._event_batch:
+            self.memory.run_log.extend_fields(self._event_batch)
+            self._event_batch.clear()
+
+    def _log_worker_event(self, event: CCNEvent) -> None:
+        """Worker event sink; queued with orchestrator events to keep emission order.
+
+        Only the fields are kept, so the CCNEvent is released right away.
+        """
+        self._event_batch.append((event.event_type, event.node_id, event.timestamp_ns, event.data))
+
+    def _run_async(self, coro: Any) -> Any:
+        """Run a coroutine to completion on the orchestrator's event loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            # asyncio primitives bind to the loop they first wait on
+            self._llm_sem = asyncio.Semaphore(self.max_inflight)
+            for key in [k for k, fut in self._role_cache.items() if not fut.done()]:
+                del self._role_cache[key]
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Release the orchestrator's event loop and the async HTTP pool used on it.
+
+        The worker's LLM client cannot make async calls afterwards.
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.run_until_complete(self.worker_node.llm_client.aclose())
+            finally:
+                self._loop.close()
+        self._loop = None
+
+    def __enter__(self) -> "MiniCCN":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _role_from_skeleton(self, kind: str) -> MaterializedRole:
+        """Return a fresh role cloned from this instance's skeleton for `kind`."""
+        skeleton = self._role_skeletons.get(kind)
+        if skeleton is None:
+            skeleton = SynapticParser.materialize_role(self._SKELETON_TEMPLATES[kind]())
+            # Immutable, so every clone can share it
+            skeleton.call_plan = tuple(skeleton.call_plan) or _DEFAULT_CALL_PLAN
+            self._role_skeletons[kind] = skeleton
+        # Containers are copied so binding never mutates the cached skeleton
+        return replace(
+            skeleton,
+            input_signals=list(skeleton.input_signals),
+            tasks=list(skeleton.tasks),
+            llm_config=_copy_llm_config(skeleton.llm_config),
+            call_args=dict(skeleton.call_args)
+        )
+
+    @staticmethod
+    def _role_key(role: MaterializedRole) -> bytes:
+        """Digest of everything that shapes a worker's prompt and its LLM call."""
+        payload = orjson.dumps(
+            [role.node_id, role.input_signals, role.tasks, role.instructions, role.llm_config],
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    async def _arun_worker(self, role: MaterializedRole) -> Any:
+        """Run a worker plan once per distinct role; duplicates await the same call."""
+        key = self._role_key(role)
+        shared = self._role_cache.get(key)
+        if shared is not None:
+            self._role_cache.move_to_end(key)
+            self._log('memory_mutation', role.node_id, {
+                'action': 'reuse_worker_result',
+                'entry_id': role.entry_id
+            })
+            return await asyncio.shield(shared)
+
+        shared = asyncio.get_running_loop().create_future()
+        self._role_cache[key] = shared
+        if len(self._role_cache) > self.ROLE_CACHE_SIZE:
+            self._role_cache.popitem(last=False)
+        try:
+            async with self._llm_sem:
+                result = await self._arun_plan(role)
+        except asyncio.CancelledError:
+            self._role_cache.pop(key, None)
+            shared.cancel()
+            raise
+        except Exception as e:
+            # Failures are not cached; waiting duplicates see the same error
+            self._role_cache.pop(key, None)
+            shared.set_exception(e)
+            shared.exception()  # Mark retrieved when no duplicate is waiting
+            raise
+        shared.set_result(result)
+        return result
+
+    @staticmethod
+    def _to_signal(output: Any) -> str:
+        """Render a worker output as a SYNTHESIZER input signal."""
+        return output if isinstance(output, str) else orjson.dumps(output).decode()
 
     def _parse_task_entry(self, index: int, item: Any) -> Dict[str, Any]:
         """Parse an individual ELUCIDATOR query_decomposition item."""
@@ -61,17 +272,15 @@ class MiniCCN:
             raise CCNError(f"ELUCIDATOR item {index + 1} is malformed: {item}")
 
         raw_text = str(item[1]).strip()
-        if 'ROLE:' not in raw_text:
+        match = _TASK_ENTRY_RE.search(raw_text)
+        if match is None:
             raise CCNError(f"ELUCIDATOR item {index + 1} missing ROLE declaration")
-
-        role_indicator = raw_text.split('ROLE:', 1)[1].strip()
-        dot_index = role_indicator.find('.')
-        if dot_index == -1:
+        if match['dot'] is None:
             raise CCNError(f"ELUCIDATOR item {index + 1} missing role description separator")
 
         # Normalize role name to reduce brittle failures from minor casing issues
-        role_name = role_indicator[:dot_index].strip().upper()
-        description = role_indicator[dot_index + 1 :].strip()
+        role_name = match['name'].strip().upper()
+        description = match['desc'].strip()
 
         if not role_name:
             raise CCNError(f"ELUCIDATOR item {index + 1} missing role name")
@@ -88,7 +297,9 @@ class MiniCCN:
             'label': item[0],
             'role_name': role_name,
             'description': description,
-            'raw_text': raw_text
+            'raw_text': raw_text,
+            # Derived once here; every bind of this spec reuses the string
+            'entry_id': f"{role_name.lower()}_{index + 1:03}"
         }
 
     def _parse_elucidator_tasks(self, items: List[Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
@@ -124,13 +335,9 @@ class MiniCCN:
             return self.worker_node.execute_role(role)
 
         # CCN-dispatch path
-        self.memory.log_event(CCNEvent(
-            event_type='role_start',
-            node_id=role.node_id,
-            data={'role': role.__dict__}
-        ))
+        self._log('role_start', role.node_id, {'role': role.summary()})
 
-        plan = role.call_plan or ['prompt_call', 'emit']
+        plan = role.call_plan or _DEFAULT_CALL_PLAN
         response: Any = None
         result: Any = None
 
@@ -150,129 +357,152 @@ class MiniCCN:
         if result is None:
             raise CCNError(f"No result produced for role {role.node_id}")
 
-        self.memory.log_event(CCNEvent(
-            event_type='role_complete',
-            node_id=role.node_id,
-            data={'result': result}
-        ))
+        self._log('role_complete', role.node_id, {'result': result})
+
+        return result
+
+    async def _arun_plan(self, role: MaterializedRole) -> Any:
+        """Awaitable `_run_plan`, used for independent worker roles."""
+        if not self.dispatch_in_ccn:
+            return await self.worker_node.aexecute_role(role)
+
+        self._log('role_start', role.node_id, {'role': role.summary()})
+
+        plan = role.call_plan or _DEFAULT_CALL_PLAN
+        response: Any = None
+        result: Any = None
+
+        for step in plan:
+            if step == 'prompt_call':
+                response = await self.worker_node.aprompt_call(role)
+            elif step == 'emit':
+                if response is None:
+                    raise CCNError(
+                        f"call_plan for {role.node_id} invoked 'emit' before "
+                        "'prompt_call'"
+                    )
+                result = self.worker_node.emit(response, role)
+            else:
+                raise CCNError(f"Unsupported plan step '{step}' for {role.node_id}")
+
+        if result is None:
+            raise CCNError(f"No result produced for role {role.node_id}")
+
+        self._log('role_complete', role.node_id, {'result': result})
 
         return result
 
     def bind_inputs(self, source_role: str, target_role: MaterializedRole,
                    source_output: Any) -> MaterializedRole:
         """Apply binding rules between roles."""
-        self.log_debug(f"Binding {source_role} -> {target_role.node_id}")
-
-        if source_role == 'USER' and target_role.node_id == 'REFORMULATOR':
-            target_role.input_signals = [str(source_output)]
-            target_role.llm_config.setdefault('response_format', {'type': 'json_object'})
-            if not target_role.call_plan:
-                target_role.call_plan = ['prompt_call', 'emit']
-            return target_role
-
-        if source_role == 'REFORMULATOR' and target_role.node_id == 'ELUCIDATOR':
-            target_role.input_signals = [str(source_output)]
-            target_role.llm_config.setdefault('response_format', {'type': 'json_object'})
-            if not target_role.call_plan:
-                target_role.call_plan = ['prompt_call', 'emit']
-            return target_role
-
-        if source_role == 'ELUCIDATOR' and target_role.node_id != 'SYNTHESIZER':
-            if not isinstance(source_output, dict):
-                raise CCNError("Worker binding requires structured task payload")
-            spec = source_output.get('task_spec')
-            if spec is None:
-                raise CCNError("Incomplete worker binding payload from ELUCIDATOR")
-
-            role_name = spec['role_name']
-            target_role.node_id = role_name
-            target_role.entry_id = f"{role_name.lower()}_{spec['index']:03}"
-            target_role.input_signals = [spec['raw_text']]
-            target_role.tasks = []
-            # Preserve any default worker instructions from the template (e.g., 70-word limit)
-            target_role.llm_config.setdefault('response_format', {'type': 'json_object'})
-            if not target_role.call_plan:
-                target_role.call_plan = ['prompt_call', 'emit']
-            return target_role
-
-        if source_role == 'ELUCIDATOR' and target_role.node_id == 'SYNTHESIZER':
-            if not isinstance(source_output, dict):
-                raise CCNError("Synthesizer binding requires structured payload")
-            spec = source_output.get('spec')
-            aggregator_payload = source_output.get('aggregator')
-            reformulated_question = source_output.get('reformulated_question')
-            if spec is None or aggregator_payload is None:
-                raise CCNError("Synthesizer binding missing specification or aggregator data")
-
-            if not isinstance(aggregator_payload, list):
-                raise CCNError("Aggregator payload must be a list of worker outputs")
-
-            # Bind full aggregator as the content input
-            # Provide one input per worker output; optionally prepend the reformulated question
-            if not all(isinstance(x, str) for x in aggregator_payload):
-                aggregator_payload = [json.dumps(x) if not isinstance(x, str) else x for x in aggregator_payload]
-            inputs = list(aggregator_payload)
-            if isinstance(reformulated_question, str) and reformulated_question:
-                inputs = [reformulated_question] + inputs
-            target_role.input_signals = inputs
-            # Carry the ELUCIDATOR final decomposition string as the SYNTHESIZER directive
-            # so it appears in the prompt per conceptualization.md
-            target_role.tasks = []
-            target_role.instructions = spec['raw_text']
-            target_role.llm_config.setdefault('response_format', {'type': 'json_object'})
-            if not target_role.call_plan:
-                target_role.call_plan = ['prompt_call', 'emit']
-            return target_role
-
-        raise CCNError(f"Unsupported binding from {source_role} to {target_role.node_id}")
+        if self.debug:
+            self.log_debug(f"Binding {source_role} -> {target_role.node_id}")
+
+        target = target_role.node_id
+        # Every non-SYNTHESIZER role bound from ELUCIDATOR is a worker
+        if source_role == 'ELUCIDATOR' and target != 'SYNTHESIZER':
+            target = 'WORKER'
+        binder = self._bind_table.get((source_role, target))
+        if binder is None:
+            raise CCNError(f"Unsupported binding from {source_role} to {target_role.node_id}")
+        binder(target_role, source_output)
+
+        # Defaults only allocate when actually missing
+        if 'response_format' not in target_role.llm_config:
+            target_role.llm_config['response_format'] = {'type': 'json_object'}
+        if not target_role.call_plan:
+            target_role.call_plan = _DEFAULT_CALL_PLAN
+        return target_role
+
+    @staticmethod
+    def _bind_text_input(target_role: MaterializedRole, source_output: Any) -> None:
+        """USER -> REFORMULATOR and REFORMULATOR -> ELUCIDATOR: one text signal."""
+        # LLM text is already a str; only other payloads go through str()
+        target_role.input_signals = [source_output if type(source_output) is str else str(source_output)]
+
+    @staticmethod
+    def _bind_worker_spec(target_role: MaterializedRole, source_output: Any) -> None:
+        """ELUCIDATOR -> worker: identity and input come from the task spec.
+
+        Default worker instructions from the template (e.g., 70-word limit)
+        are preserved.
+        """
+        if not isinstance(source_output, dict):
+            raise CCNError("Worker binding requires structured task payload")
+        spec = source_output.get('task_spec')
+        if spec is None:
+            raise CCNError("Incomplete worker binding payload from ELUCIDATOR")
+
+        target_role.node_id = spec['role_name']
+        target_role.entry_id = spec['entry_id']
+        target_role.input_signals = [spec['raw_text']]
+        target_role.tasks = []
+
+    @staticmethod
+    def _bind_synthesizer(target_role: MaterializedRole, source_output: Any) -> None:
+        """ELUCIDATOR -> SYNTHESIZER: aggregator outputs plus the final directive."""
+        if not isinstance(source_output, dict):
+            raise CCNError("Synthesizer binding requires structured payload")
+        spec = source_output.get('spec')
+        aggregator_payload = source_output.get('aggregator')
+        reformulated_question = source_output.get('reformulated_question')
+        if spec is None or aggregator_payload is None:
+            raise CCNError("Synthesizer binding missing specification or aggregator data")
+
+        if not isinstance(aggregator_payload, list):
+            raise CCNError("Aggregator payload must be a list of worker outputs")
+
+        # Bind full aggregator as the content input
+        # Provide one input per worker output; optionally prepend the reformulated question.
+        # Signals from _record_worker_result are already strings and pass through
+        # as-is; other callers' dict/list items are serialized in the same pass
+        # that builds the input list
+        if isinstance(reformulated_question, str) and reformulated_question:
+            inputs = [reformulated_question]
+        else:
+            inputs = []
+        inputs.extend(map(MiniCCN._to_signal, aggregator_payload))
+        target_role.input_signals = inputs
+        # Carry the ELUCIDATOR final decomposition string as the SYNTHESIZER directive
+        # so it appears in the prompt per conceptualization.md
+        target_role.tasks = []
+        target_role.instructions = spec['raw_text']
     
+    @contextmanager
+    def _activate(self, role: MaterializedRole) -> Iterator[MaterializedRole]:
+        """Log and hold role in the active slot; records its wall time on success."""
+        self._log('memory_mutation', role.node_id,
+                  {'action': 'set_active_role', 'role_id': role.node_id})
+        start = time.perf_counter_ns()
+        with self.memory.active_role(role):
+            yield role
+        self.role_timings.append((role.node_id, time.perf_counter_ns() - start))
+
     def process_reformulator(self, user_input: str) -> str:
         """Process REFORMULATOR role."""
         self.log_debug("Processing REFORMULATOR")
         
         # Create and materialize role
-        synaptic_list = NodeTemplates.create_reformulator(user_input)
-        role = SynapticParser.materialize_role(synaptic_list)
+        role = self._role_from_skeleton('REFORMULATOR')
         role = self.bind_inputs('USER', role, user_input)
 
-        # Set as active
-        self.memory.set_active_role(role)
-        self.memory.log_event(CCNEvent(
-            event_type='memory_mutation',
-            node_id='REFORMULATOR',
-            data={'action': 'set_active_role', 'role_id': role.node_id}
-        ))
-        
         # Execute role
         try:
-            result = self._run_plan(role)
-            
-            # Archive result
-            record = PerRoleRecord(
-                node_id=role.node_id,
-                entry_id=role.entry_id,
-                input_signals=role.input_signals,
-                node_output_signal=result,
-                tasks=role.tasks
-            )
-            self.memory.add_to_archive(record)
+            with self._activate(role):
+                result = self._run_plan(role)
 
-            # Clear active
-            self.memory.clear_active_role()
+                # Archive result
+                self._archive_role(role, result)
 
             self.reformulated_question = result
-            self.metrics['roles_processed'] += 1
+            self.metrics.roles_processed += 1
 
             return result
             
         except Exception as e:
-            self.memory.log_event(CCNEvent(
-                event_type='error',
-                node_id='REFORMULATOR',
-                data={'error': str(e)}
-            ))
+            self._log('error', 'REFORMULATOR', {'error': str(e)})
             if isinstance(e, LLMError):
-                self.metrics['llm_errors'] += 1
+                self.metrics.llm_errors += 1
             raise CCNError(f"REFORMULATOR failed: {str(e)}")
     
     def process_elucidator(self, reformulated_question: str) -> List[List[str]]:
@@ -280,243 +510,288 @@ class MiniCCN:
         self.log_debug("Processing ELUCIDATOR")
         
         # Create and materialize role
-        synaptic_list = NodeTemplates.create_elucidator(reformulated_question)
-        role = SynapticParser.materialize_role(synaptic_list)
+        role = self._role_from_skeleton('ELUCIDATOR')
         role = self.bind_inputs('REFORMULATOR', role, reformulated_question)
 
-        # Set as active
-        self.memory.set_active_role(role)
-        self.memory.log_event(CCNEvent(
-            event_type='memory_mutation',
-            node_id='ELUCIDATOR',
-            data={'action': 'set_active_role', 'role_id': role.node_id}
-        ))
-        
         # Execute role
         try:
-            result = self._run_plan(role)
-            self.pending_worker_specs.clear()
-            try:
-                worker_specs, synthesizer_spec = self._parse_elucidator_tasks(result)
-            except CCNError:
-                self.metrics['parse_errors'] += 1
-                raise
-
-            # Archive result
-            record = PerRoleRecord(
-                node_id=role.node_id,
-                entry_id=role.entry_id,
-                input_signals=role.input_signals,
-                node_output_signal=str(result),
-                tasks=role.tasks
-            )
-            self.memory.add_to_archive(record)
+            with self._activate(role):
+                result = self._run_plan(role)
+                self._worker_pairs = []
+                try:
+                    worker_specs, synthesizer_spec = self._parse_elucidator_tasks(result)
+                except CCNError:
+                    self.metrics.parse_errors += 1
+                    raise
 
-            # Clear active and enqueue worker tasks
-            self.memory.clear_active_role()
+                # Archive result
+                self._archive_role(role, str(result))
+
+            # Enqueue worker tasks
 
-            self.pending_worker_specs = deque(worker_specs)
             self.synthesizer_spec = synthesizer_spec
             self.memory.aggregator_buffer.clear()
+            self._aggregator_signals.clear()
 
-            self.metrics['roles_processed'] += 1
+            self.metrics.roles_processed += 1
 
             for spec in worker_specs:
-                worker_synaptic = NodeTemplates.create_worker_role(spec['role_name'], spec['index'])
+                worker_synaptic = _worker_entry(spec['role_name'], spec['index'])
                 try:
                     self.memory.add_to_worklist(worker_synaptic)
                 except ValueError as exc:
                     raise CCNError(str(exc))
-                self.metrics['enqueued_roles'] += 1
+                self._worker_pairs.append((worker_synaptic, spec))
+                self.metrics.enqueued_roles += 1
 
-            synthesizer_synaptic = NodeTemplates.create_synthesizer()
+            synthesizer_synaptic = _synthesizer_entry()
             try:
                 self.memory.add_to_worklist(synthesizer_synaptic)
             except ValueError as exc:
                 raise CCNError(str(exc))
-            self.metrics['enqueued_roles'] += 1
+            self.metrics.enqueued_roles += 1
 
             return result
             
         except Exception as e:
-            self.memory.log_event(CCNEvent(
-                event_type='error',
-                node_id='ELUCIDATOR',
-                data={'error': str(e)}
-            ))
+            self._log('error', 'ELUCIDATOR', {'error': str(e)})
             if isinstance(e, LLMError):
-                self.metrics['llm_errors'] += 1
+                self.metrics.llm_errors += 1
             raise CCNError(f"ELUCIDATOR failed: {str(e)}")
     
-    def process_worker_role(self, synaptic_list: SynapticKVList) -> str:
-        """Process a worker role from worklist."""
-        self.log_debug("Processing worker role")
-        
-        # Materialize role
-        role = SynapticParser.materialize_role(synaptic_list)
-
-        if not self.pending_worker_specs:
-            raise CCNError("No worker specification available for enqueued role")
+    def _bind_worker(self, spec: Dict[str, Any]) -> MaterializedRole:
+        """Clone a worker role and bind its ELUCIDATOR spec.
 
-        spec = self.pending_worker_specs.popleft()
-        role = self.bind_inputs('ELUCIDATOR', role, {
+        Enqueued worker entries only carry node_id/entry_id placeholders,
+        which binding overwrites from the spec, so they are not re-parsed.
+        """
+        role = self._role_from_skeleton('WORKER')
+        return self.bind_inputs('ELUCIDATOR', role, {
             'task_spec': spec
         })
 
-        # Set as active
-        self.memory.set_active_role(role)
-        self.memory.log_event(CCNEvent(
-            event_type='memory_mutation',
+    def _archive_role(self, role: MaterializedRole, result: str, final: bool = False) -> None:
+        """Archive a role's output according to `archive_mode`."""
+        if self.archive_mode == 'full':
+            input_signals = role.input_signals
+        elif final and self.archive_mode == 'final':
+            # Only the answer is kept; the aggregator-sized inputs are dropped
+            input_signals = []
+        else:
+            return
+        self.memory.add_to_archive(PerRoleRecord(
             node_id=role.node_id,
-            data={'action': 'set_active_role', 'role_id': role.node_id}
+            entry_id=role.entry_id,
+            input_signals=input_signals,
+            node_output_signal=result,
+            tasks=role.tasks
         ))
+
+    def _record_worker_result(self, role: MaterializedRole, result: str,
+                              signal: Optional[str] = None) -> str:
+        """Append a worker result to the aggregator buffer and archive."""
+        # Add to aggregator buffer
+        # Append a formatted item that carries the original decomposition header and the worker output
+        try:
+            self.memory.add_to_aggregator(result)
+        except ValueError as exc:
+            raise CCNError(str(exc))
+        self._aggregator_signals.append(signal if signal is not None else self._to_signal(result))
+        self._log('memory_mutation', role.node_id, {
+            'action': 'add_to_aggregator',
+            # One allocation for the trimmed preview; short results are shared as-is
+            'result': f"{result[:200]}..." if len(result) > 200 else result
+        })
+        self.metrics.aggregator_appends += 1
         
+        # Archive result
+        self._archive_role(role, result)
+        self.metrics.roles_processed += 1
+        return result
+
+    def _worker_failed(self, role: MaterializedRole, e: Exception) -> str:
+        """Log a worker failure; LLM errors become placeholder outputs."""
+        self._log('error', role.node_id, {'error': str(e)})
+        # Continue execution even if worker fails
+        if isinstance(e, LLMError):
+            self.metrics.llm_errors += 1
+            return f"Error in {role.node_id}: {str(e)}"
+        raise CCNError(str(e))
+
+    def process_worker_role(self, synaptic_list: SynapticKVList, spec: Dict[str, Any]) -> str:
+        """Process a worker role from worklist with its ELUCIDATOR spec."""
+        self.log_debug("Processing worker role")
+
+        role = self._bind_worker(spec)
+
         # Execute role
         try:
-            result = self._run_plan(role)
-            
-            # Add to aggregator buffer
-            # Append a formatted item that carries the original decomposition header and the worker output
-            try:
-                self.memory.add_to_aggregator(result)
-            except ValueError as exc:
-                raise CCNError(str(exc))
-            self.memory.log_event(CCNEvent(
-                event_type='memory_mutation',
-                node_id=role.node_id,
-                data={'action': 'add_to_aggregator', 'result': result[:200] + '...' if len(result) > 200 else result}
-            ))
-            self.metrics['aggregator_appends'] += 1
-            
-            # Archive result
-            record = PerRoleRecord(
-                node_id=role.node_id,
-                entry_id=role.entry_id,
-                input_signals=role.input_signals,
-                node_output_signal=result,
-                tasks=role.tasks
-            )
-            self.memory.add_to_archive(record)
-            
-            # Clear active
-            self.memory.clear_active_role()
-            self.metrics['roles_processed'] += 1
-            
+            with self._activate(role):
+                result = self._run_plan(role)
+                self._record_worker_result(role, result)
+
             return result
             
         except Exception as e:
-            self.memory.log_event(CCNEvent(
-                event_type='error',
-                node_id=role.node_id,
-                data={'error': str(e)}
-            ))
-            # Continue execution even if worker fails
-            if isinstance(e, LLMError):
-                self.metrics['llm_errors'] += 1
-                return f"Error in {role.node_id}: {str(e)}"
-            raise CCNError(str(e))
+            return self._worker_failed(role, e)
+
+    async def _run_workers(self, roles: List[MaterializedRole]) -> Tuple[List[Any], List[Optional[str]]]:
+        """Run worker plans concurrently; outcomes follow `roles` order.
+
+        Results are consumed as they complete, so each one is serialized into
+        its SYNTHESIZER signal while slower workers are still in flight.
+        Each worker logs `set_active_role` as it starts and, on success, adds
+        its wall time to `role_timings` (in `roles` order), as `_activate`
+        does on the sequential path; the single active slot is not used.
+        """
+        outcomes: List[Any] = [None] * len(roles)
+        signals: List[Optional[str]] = [None] * len(roles)
+        timings: List[Optional[Tuple[str, int]]] = [None] * len(roles)
+
+        async def run(index: int, role: MaterializedRole) -> Tuple[int, Any]:
+            self._log('memory_mutation', role.node_id,
+                      {'action': 'set_active_role', 'role_id': role.node_id})
+            start = time.perf_counter_ns()
+            try:
+                outcome = await self._arun_worker(role)
+            except Exception as e:
+                return index, e
+            timings[index] = (role.node_id, time.perf_counter_ns() - start)
+            return index, outcome
+
+        # Tasks are created in spec order so workers start (and log) in that order
+        tasks = [asyncio.ensure_future(run(i, role)) for i, role in enumerate(roles)]
+        for next_done in asyncio.as_completed(tasks):
+            index, outcome = await next_done
+            outcomes[index] = outcome
+            if not isinstance(outcome, Exception):
+                signals[index] = self._to_signal(outcome)
+        self.role_timings.extend(timing for timing in timings if timing is not None)
+        return outcomes, signals
+
+    def process_worker_roles(self, worker_pairs: List[Tuple[SynapticKVList, Dict[str, Any]]]) -> List[str]:
+        """Process independent worker roles with overlapping LLM calls.
+
+        Each role is bound to its spec before anything is awaited, and results
+        are recorded in spec order afterwards, so the aggregator and archive
+        match the sequential path. Per-worker events (set_active_role,
+        role_start, prompt/response) interleave in the run log as the calls
+        overlap, rather than appearing worker by worker.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Called from inside an event loop (asyncio app, notebook): it cannot
+            # be blocked on, so the workers run one after another instead
+            return [self.process_worker_role(synaptic, spec) for synaptic, spec in worker_pairs]
+
+        if self.debug:
+            self.log_debug(f"Processing {len(worker_pairs)} worker roles concurrently")
+
+        roles = [self._bind_worker(spec) for _, spec in worker_pairs]
+
+        outcomes, signals = self._run_async(self._run_workers(roles))
+
+        results = []
+        for role, outcome, signal in zip(roles, outcomes, signals):
+            if isinstance(outcome, Exception):
+                results.append(self._worker_failed(role, outcome))
+                continue
+            try:
+                results.append(self._record_worker_result(role, outcome, signal))
+            except Exception as e:
+                results.append(self._worker_failed(role, e))
+        return results
     
     def process_synthesizer(self) -> str:
         """Process SYNTHESIZER role."""
         self.log_debug("Processing SYNTHESIZER")
         
         # Create and materialize role
-        synaptic_list = NodeTemplates.create_synthesizer()
-        role = SynapticParser.materialize_role(synaptic_list)
+        role = self._role_from_skeleton('SYNTHESIZER')
         if self.synthesizer_spec is None:
             raise CCNError("Missing synthesizer specification from ELUCIDATOR")
         role = self.bind_inputs('ELUCIDATOR', role, {
             'spec': self.synthesizer_spec,
-            'aggregator': list(self.memory.aggregator_buffer),
+            # Pre-serialized signals: binding skips re-rendering the outputs and
+            # builds the role's own list, so the buffer is passed without a copy
+            'aggregator': self._aggregator_signals,
             'reformulated_question': self.reformulated_question
         })
 
-        # Set as active
-        self.memory.set_active_role(role)
-        self.memory.log_event(CCNEvent(
-            event_type='memory_mutation',
-            node_id='SYNTHESIZER',
-            data={'action': 'set_active_role', 'role_id': role.node_id}
-        ))
-        
         # Execute role
         try:
-            result = self.worker_node.execute_role(role)
-            
-            # Archive result
-            record = PerRoleRecord(
-                node_id=role.node_id,
-                entry_id=role.entry_id,
-                input_signals=role.input_signals,
-                node_output_signal=result,
-                tasks=role.tasks
-            )
-            self.memory.add_to_archive(record)
-            
-            # Clear active
-            self.memory.clear_active_role()
-            self.metrics['roles_processed'] += 1
-            self.pending_worker_specs.clear()
+            with self._activate(role):
+                result = self.worker_node.execute_role(role)
+
+                # Archive result
+                self._archive_role(role, result, final=True)
+
+            self.metrics.roles_processed += 1
+            self._worker_pairs = []
             self.synthesizer_spec = None
             
             return result
             
         except Exception as e:
-            self.memory.log_event(CCNEvent(
-                event_type='error',
-                node_id='SYNTHESIZER',
-                data={'error': str(e)}
-            ))
+            self._log('error', 'SYNTHESIZER', {'error': str(e)})
             if isinstance(e, LLMError):
-                self.metrics['llm_errors'] += 1
+                self.metrics.llm_errors += 1
             raise CCNError(f"SYNTHESIZER failed: {str(e)}")
     
     def execute(self, user_input: str) -> str:
         """Execute complete CCN cycle."""
         self.log_debug("Starting CCN execution")
-        self.metrics = {
-            'roles_processed': 0,
-            'enqueued_roles': 0,
-            'aggregator_appends': 0,
-            'llm_errors': 0,
-            'parse_errors': 0
-        }
+        self.metrics = _Metrics()
+        self.role_timings = []
+        self._role_cache.clear()
 
         try:
             # Phase 1: REFORMULATOR
             reformulated = self.process_reformulator(user_input)
-            self.log_debug(f"REFORMULATOR output: {reformulated[:100]}...")
+            if self.debug:
+                self.log_debug(f"REFORMULATOR output: {reformulated[:100]}...")
             
             # Phase 2: ELUCIDATOR
             tasks = self.process_elucidator(reformulated)
-            self.log_debug(f"ELUCIDATOR created {len(tasks)} tasks")
+            if self.debug:
+                self.log_debug(f"ELUCIDATOR created {len(tasks)} tasks")
             
-            # Phase 3: Worker roles (processed from worklist)
+            # Phase 3: Worker roles (drained from worklist up to SYNTHESIZER)
+            synthesizer_seen = False
             while self.memory.worklist:
                 synaptic_list = self.memory.pop_from_worklist()
-                role = SynapticParser.materialize_role(synaptic_list)
                 
-                if role.node_id == 'SYNTHESIZER':
-                    # Phase 4: SYNTHESIZER
-                    final_result = self.process_synthesizer()
-                    self.log_debug("SYNTHESIZER completed")
-                    return final_result
-                else:
-                    # Process worker role
-                    self.process_worker_role(synaptic_list)
-            
+                if synaptic_list.get('attributes.node_id') == 'SYNTHESIZER':
+                    synthesizer_seen = True
+                    break
+
+            # Workers only depend on ELUCIDATOR output, so their calls overlap;
+            # each pair already carries its spec
+            if self._worker_pairs:
+                self.process_worker_roles(self._worker_pairs)
+
             # If we get here without SYNTHESIZER, something went wrong
-            raise CCNError("Execution completed without SYNTHESIZER")
+            if not synthesizer_seen:
+                raise CCNError("Execution completed without SYNTHESIZER")
+
+            # Phase 4: SYNTHESIZER
+            final_result = self.process_synthesizer()
+            self.log_debug("SYNTHESIZER completed")
+            return final_result
             
         except Exception as e:
-            self.memory.log_event(CCNEvent(
-                event_type='error',
-                data={'error': str(e), 'fatal': True}
-            ))
+            self._log('error', None, {'error': str(e), 'fatal': True})
             raise
+
+        finally:
+            self._flush_events()
     
     def get_execution_summary(self) -> Dict[str, Any]:
         """Get summary of execution."""
+        self._flush_events()
         return {
             'archive_size': len(self.memory.archive),
             'events_count': len(self.memory.run_log),
@@ -526,4 +801,4 @@ class MiniCCN:
 
     def get_metrics(self) -> Dict[str, int]:
         """Return collected metrics for the most recent execution."""
-        return dict(self.metrics)
+        return self.metrics.as_dict()
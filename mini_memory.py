@@ -1,14 +1,23 @@
 """MEMORY dataclasses and data structures for CCN app."""
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Deque, Sequence, Tuple, Union
 from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 import json
+import time
 from llm_config import get_default_llm_config
 
 
-@dataclass
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Local naive datetime for a time.time_ns() value, to the microsecond."""
+    return datetime.fromtimestamp(timestamp_ns // 1_000_000_000).replace(
+        microsecond=timestamp_ns // 1_000 % 1_000_000
+    )
+
+
+@dataclass(slots=True)
 class SynapticKV:
     """Key-value pair for SYNAPTIC lists."""
     key: str
@@ -24,28 +33,37 @@ class SynapticKV:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class SynapticKVList:
-    """List of SYNAPTIC key-value pairs."""
+    """List of SYNAPTIC key-value pairs.
+
+    `_map` indexes the first value per key for O(1) lookups; add pairs with
+    `add()` rather than appending to `kvs` so the index stays in sync.
+    """
     kvs: List[SynapticKV] = field(default_factory=list)
+    _map: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index pairs passed to the constructor."""
+        for kv in self.kvs:
+            self._map.setdefault(kv.key, kv.value)
     
     def add(self, key: str, value: Any) -> None:
         """Add a key-value pair."""
         self.kvs.append(SynapticKV(key=key, value=value))
+        # First value wins, as with the former linear scan
+        self._map.setdefault(key, value)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get value by key."""
-        for kv in self.kvs:
-            if kv.key == key:
-                return kv.value
-        return default
+        return self._map.get(key, default)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {kv.key: kv.value for kv in self.kvs}
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterializedRole:
     """Materialized role with attributes and LLM config."""
     node_id: str
@@ -55,7 +73,7 @@ class MaterializedRole:
     tasks: List[str] = field(default_factory=list)
     instructions: str = ""
     llm_config: Dict[str, Any] = field(default_factory=dict)
-    call_plan: List[str] = field(default_factory=list)
+    call_plan: Sequence[str] = field(default_factory=list)
     call_args: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -63,8 +81,20 @@ class MaterializedRole:
         if not self.llm_config:
             self.llm_config = get_default_llm_config()
 
+    def summary(self) -> Dict[str, Any]:
+        """Identity and plan for role_start events.
 
-@dataclass
+        A detached copy rather than the live attribute dict; inputs are
+        already logged in the prompt_window events.
+        """
+        return {
+            "role_id": self.node_id,
+            "entry_id": self.entry_id,
+            "plan": list(self.call_plan)
+        }
+
+
+@dataclass(slots=True)
 class PerRoleRecord:
     """Record of a role execution."""
     node_id: str
@@ -72,8 +102,14 @@ class PerRoleRecord:
     input_signals: List[str]
     node_output_signal: Optional[str]
     tasks: List[str]
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Captured as time.time_ns(); turned into a datetime only when read
+    timestamp_ns: int = field(default_factory=time.time_ns)
     error: Optional[str] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime."""
+        return _ns_to_datetime(self.timestamp_ns)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -88,13 +124,19 @@ class PerRoleRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CCNEvent:
     """CCN execution event."""
     event_type: str  # 'role_start', 'role_complete', 'error', 'prompt_window', 'memory_mutation'
     node_id: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Captured as time.time_ns(); turned into a datetime only when read
+    timestamp_ns: int = field(default_factory=time.time_ns)
     data: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Emission time as a local datetime."""
+        return _ns_to_datetime(self.timestamp_ns)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -106,14 +148,82 @@ class CCNEvent:
         }
 
 
-@dataclass
+class EventLog:
+    """Append-only run log stored as parallel columns.
+
+    Events are appended often and read in bulk, so fields are kept in one
+    list per attribute instead of a CCNEvent per entry. Indexing and
+    iteration return CCNEvent views built on demand.
+    """
+
+    __slots__ = ("event_types", "node_ids", "timestamps_ns", "datas")
+
+    def __init__(self) -> None:
+        self.event_types: List[str] = []
+        self.node_ids: List[Optional[str]] = []
+        self.timestamps_ns: List[int] = []
+        self.datas: List[Dict[str, Any]] = []
+
+    def append(self, event: CCNEvent) -> None:
+        """Store an event's fields."""
+        self.append_fields(event.event_type, event.node_id, event.timestamp_ns, event.data)
+
+    def append_fields(self, event_type: str, node_id: Optional[str],
+                      timestamp_ns: int, data: Dict[str, Any]) -> None:
+        """Store an event given as separate fields (no CCNEvent needed)."""
+        self.event_types.append(event_type)
+        self.node_ids.append(node_id)
+        self.timestamps_ns.append(timestamp_ns)
+        self.datas.append(data)
+
+    def extend_fields(self, entries: Iterable[Tuple[str, Optional[str], int, Dict[str, Any]]]) -> None:
+        """Store (event_type, node_id, timestamp_ns, data) tuples in order."""
+        for event_type, node_id, timestamp_ns, data in entries:
+            self.event_types.append(event_type)
+            self.node_ids.append(node_id)
+            self.timestamps_ns.append(timestamp_ns)
+            self.datas.append(data)
+
+    def __len__(self) -> int:
+        return len(self.event_types)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CCNEvent, List[CCNEvent]]:
+        if isinstance(index, slice):
+            # A list of events, as slicing the former List[CCNEvent] gave
+            return [
+                CCNEvent(*fields)
+                for fields in zip(self.event_types[index], self.node_ids[index],
+                                  self.timestamps_ns[index], self.datas[index])
+            ]
+        return CCNEvent(self.event_types[index], self.node_ids[index],
+                        self.timestamps_ns[index], self.datas[index])
+
+    def __iter__(self) -> Iterator[CCNEvent]:
+        for fields in zip(self.event_types, self.node_ids, self.timestamps_ns, self.datas):
+            yield CCNEvent(*fields)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Serialize every event as CCNEvent.to_dict would, straight from the columns."""
+        return [
+            {
+                "event_type": event_type,
+                "node_id": node_id,
+                "timestamp": _ns_to_datetime(timestamp_ns).isoformat(),
+                "data": data
+            }
+            for event_type, node_id, timestamp_ns, data
+            in zip(self.event_types, self.node_ids, self.timestamps_ns, self.datas)
+        ]
+
+
+@dataclass(slots=True)
 class MEMORY:
     """Main MEMORY structure."""
     worklist: Deque[SynapticKVList] = field(default_factory=deque)
     active_slot: Optional[MaterializedRole] = None
     archive: List[PerRoleRecord] = field(default_factory=list)
     aggregator_buffer: List[Any] = field(default_factory=list)
-    run_log: List[CCNEvent] = field(default_factory=list)
+    run_log: EventLog = field(default_factory=EventLog)
     worklist_capacity: int = 100
     aggregator_capacity: int = 100
     
@@ -150,12 +260,23 @@ class MEMORY:
     def clear_active_role(self) -> None:
         """Clear active role slot."""
         self.active_slot = None
+
+    @contextmanager
+    def active_role(self, role: MaterializedRole) -> Iterator[MaterializedRole]:
+        """Hold role in the active slot for the duration of a with-block.
+
+        The slot is only cleared on normal exit; a failing role stays in place
+        for inspection.
+        """
+        self.set_active_role(role)
+        yield role
+        self.clear_active_role()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert MEMORY to dictionary for debugging."""
         return {
             "worklist_size": len(self.worklist),
-            "active_slot": self.active_slot.__dict__ if self.active_slot else None,
+            "active_slot": asdict(self.active_slot) if self.active_slot else None,
             "archive_size": len(self.archive),
             "aggregator_buffer_size": len(self.aggregator_buffer),
             "run_log_size": len(self.run_log)
@@ -12,7 +12,7 @@ class ValidationError(Exception):
 class SynapticParser:
     """Parser for SYNAPTIC KV lists with strict validation."""
     
-    ALLOWED_KEYS = {
+    ALLOWED_KEYS = frozenset({
         # Attributes
         'attributes.node_id',
         'attributes.entry_id', 
@@ -28,7 +28,7 @@ class SynapticParser:
         'llm_config.response_format',
         'call_plan',
         'call_args'
-    }
+    })
     
     KEY_TYPES = {
         'attributes.node_id': str,
@@ -49,16 +49,14 @@ class SynapticParser:
     @classmethod
     def validate_kv(cls, kv: SynapticKV) -> None:
         """Validate a single key-value pair."""
-        if kv.key not in cls.ALLOWED_KEYS:
+        # KEY_TYPES covers exactly ALLOWED_KEYS, so one lookup answers both checks
+        expected_type = cls.KEY_TYPES.get(kv.key)
+        if expected_type is None:
             raise ValidationError(f"Key '{kv.key}' not in allowed keys: {cls.ALLOWED_KEYS}")
         
-        expected_type = cls.KEY_TYPES[kv.key]
+        # isinstance accepts a type or a tuple of types directly
         if not isinstance(kv.value, expected_type):
-            if isinstance(expected_type, tuple):
-                if not any(isinstance(kv.value, t) for t in expected_type):
-                    raise ValidationError(f"Key '{kv.key}' expects type {expected_type}, got {type(kv.value)}")
-            else:
-                raise ValidationError(f"Key '{kv.key}' expects type {expected_type}, got {type(kv.value)}")
+            raise ValidationError(f"Key '{kv.key}' expects type {expected_type}, got {type(kv.value)}")
     
     @classmethod
     def validate_synaptic_list(cls, synaptic_list: SynapticKVList) -> None:
@@ -111,7 +109,7 @@ class SynapticParser:
         """Materialize a role from SYNAPTIC list."""
         cls.validate_synaptic_list(synaptic_list)
         
-        # Extract attributes
+        # Extract attributes (validated above, so keys are unique)
         node_id = synaptic_list.get('attributes.node_id', '')
         entry_id = synaptic_list.get('attributes.entry_id', '')
         input_signals = synaptic_list.get('attributes.input_signals', [])
@@ -120,17 +118,13 @@ class SynapticParser:
         instructions = synaptic_list.get('attributes.instructions', '')
         
         # Extract LLM config and call plan/args
-        llm_config = {}
-        call_plan: List[str] = []
-        call_args: Dict[str, Any] = {}
-        for kv in synaptic_list.kvs:
-            if kv.key.startswith('llm_config.'):
-                config_key = kv.key.replace('llm_config.', '')
-                llm_config[config_key] = kv.value
-            elif kv.key == 'call_plan':
-                call_plan = kv.value
-            elif kv.key == 'call_args':
-                call_args = kv.value
+        llm_config = {
+            kv.key[len('llm_config.'):]: kv.value
+            for kv in synaptic_list.kvs
+            if kv.key.startswith('llm_config.')
+        }
+        call_plan: List[str] = synaptic_list.get('call_plan', [])
+        call_args: Dict[str, Any] = synaptic_list.get('call_args', {})
 
         return MaterializedRole(
             node_id=node_id,
@@ -55,6 +55,9 @@ def main() -> None:
         result = ccn.execute(query)
     except CCNError as exc:
         raise SystemExit(f"CCN execution failed: {exc}") from exc
+    finally:
+        # Release the event loop and async HTTP pool; memory stays readable
+        ccn.close()
 
     role_logs: Dict[str, RoleLog] = {}
     ordered_roles = []
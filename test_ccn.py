@@ -11,6 +11,86 @@ from typing import Dict, Any, List
 # Add the output directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from llm_providers import LLMProvider
+
+
+class StubProvider(LLMProvider):
+    """Offline provider answering by the role named in the prompt header.
+
+    `delays` (seconds, async path only) make workers finish out of spec order;
+    roles in `failures` raise like a failed API call.
+    """
+
+    DECOMPOSITION = [
+        ["t1", "ROLE: ALPHA. Do alpha."],
+        ["t2", "ROLE: BETA. Do beta."],
+        ["t3", "ROLE: GAMMA. Do gamma."],
+        ["t4", "ROLE: SYNTHESIZER. Combine all."],
+    ]
+
+    def __init__(self, decomposition=None, outputs=None, delays=None, failures=()):
+        super().__init__("stub")
+        self.decomposition = decomposition or self.DECOMPOSITION
+        self.outputs = outputs or {}
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.calls: List[tuple] = []
+        self.completed: List[str] = []
+        self.inflight = 0
+        self.peak_inflight = 0
+        self._raw = None
+
+    @staticmethod
+    def role_of(prompt: str) -> str:
+        return prompt.split("\n", 1)[0][len("Role: "):]
+
+    def call_completion(self, prompt, model, temperature, max_tokens,
+                        reasoning_effort=None, response_format=None, **kwargs):
+        role = self.role_of(prompt)
+        self.calls.append((role, model, temperature))
+        if role in self.failures:
+            raise RuntimeError(f"{role} unavailable")
+        if role == "REFORMULATOR":
+            result = {"reformulated_question": "What is X?"}
+        elif role == "ELUCIDATOR":
+            result = {"query_decomposition": self.decomposition}
+        else:
+            result = self.outputs.get(role, {"node_output_signal": f"{role} output"})
+        self.completed.append(role)
+        self._raw = json.dumps(result)
+        return dict(result)
+
+    async def acall_completion(self, prompt, **kwargs):
+        import asyncio
+        self.inflight += 1
+        self.peak_inflight = max(self.peak_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.delays.get(self.role_of(prompt), 0))
+        finally:
+            self.inflight -= 1
+        return self.call_completion(prompt, **kwargs)
+
+    def get_provider_name(self):
+        return "stub"
+
+    def get_api_key_env_var(self):
+        return "STUB_API_KEY"
+
+    def test_connection(self):
+        return True
+
+    @property
+    def last_raw_response(self):
+        return self._raw
+
+
+def stub_ccn(provider: StubProvider, **kwargs):
+    """MiniCCN wired to `provider`; use as a context manager."""
+    from llm_client import LLMClient
+    from worker_node import WorkerNode
+    from mini_ccn import MiniCCN
+    return MiniCCN(WorkerNode(LLMClient(provider=provider)), **kwargs)
+
 def test_imports():
     """Test that all modules can be imported."""
     print("Testing imports...")
@@ -53,6 +133,41 @@ def test_memory_structures():
         print(f"✗ MEMORY test failed: {e}")
         return False
 
+def test_event_log():
+    """Test the columnar EventLog behaves like the former List[CCNEvent]."""
+    print("\nTesting event log...")
+    from datetime import datetime
+    from mini_memory import CCNEvent, EventLog
+
+    events = [
+        CCNEvent('role_start', 'ALPHA', 1_700_000_000_123_456_789, {'n': 0}),
+        CCNEvent('memory_mutation', None, 1_700_000_001_000_000_000, {'n': 1}),
+        CCNEvent('role_complete', 'ALPHA', 1_700_000_002_999_999_999, {'n': 2}),
+    ]
+    log = EventLog()
+    log.append(events[0])
+    log.extend_fields((e.event_type, e.node_id, e.timestamp_ns, e.data) for e in events[1:])
+
+    assert len(log) == 3
+    assert log[0] == events[0] and log[2] == events[2]
+    assert log[-1] == events[-1] and log[-3] == events[0]
+    print("✓ Integer and negative indexing")
+
+    assert log[-1:] == events[-1:]
+    assert log[::2] == events[::2]
+    assert log[5:] == []
+    assert all(isinstance(event, CCNEvent) for event in log[:])
+    print("✓ Slices return lists of CCNEvent")
+
+    assert list(log) == events
+    print("✓ Iteration follows append order")
+
+    dicts = log.to_dicts()
+    assert dicts == [event.to_dict() for event in events]
+    assert datetime.fromisoformat(dicts[0]['timestamp']).microsecond == 123456
+    print("✓ to_dicts() matches CCNEvent.to_dict()")
+    return True
+
 def test_synaptic_validation():
     """Test SYNAPTIC validation."""
     print("\nTesting SYNAPTIC validation...")
@@ -166,6 +281,37 @@ def test_schema_validation():
         print(f"✗ Schema validation test failed: {e}")
         return False
 
+def test_archive_validation():
+    """Test batched archive validation in ccn_minirun."""
+    print("\nTesting archive validation...")
+    try:
+        from ccn_minirun import validate_archive
+
+        valid_record = {
+            "node_id": "TEST_ROLE",
+            "entry_id": "test_001",
+            "input_signals": ["test input"],
+            "node_output_signal": "test output",
+            "tasks": [],
+            "timestamp": "2024-01-01T12:00:00.000000"
+        }
+
+        if not validate_archive([valid_record, valid_record]):
+            print("✗ Valid archive failed validation")
+            return False
+        print("✓ Valid archive passed validation")
+
+        # Non-strict mode stops at the first bad record and reports False
+        if validate_archive([{"node_id": "TEST_ROLE"}, valid_record]):
+            print("✗ Invalid archive passed validation (should fail)")
+            return False
+        print("✓ Invalid archive correctly rejected")
+
+        return True
+    except Exception as e:
+        print(f"✗ Archive validation test failed: {e}")
+        return False
+
 def test_cli_basic():
     """Test CLI basic functionality."""
     print("\nTesting CLI basic functionality...")
@@ -198,6 +344,292 @@ def test_cli_basic():
         print(f"✗ CLI test failed: {e}")
         return False
 
+def test_completion_cache():
+    """Test deterministic-call caching in LLMClient and DeepSeekProvider."""
+    print("\nTesting completion caching...")
+    import asyncio
+    from types import SimpleNamespace
+    from llm_client import LLMClient
+
+    params = {'model': 'stub-model', 'max_tokens': 16,
+              'response_format': {'type': 'json_object'}}
+    provider = StubProvider()
+    client = LLMClient(provider=provider)
+    for role in ('A', 'B', 'A'):
+        client.call_completion(f"Role: {role}", temperature=0.0, **params)
+    assert [call[0] for call in provider.calls] == ['A', 'B']
+    assert client.last_raw_response == json.dumps({'node_output_signal': 'A output'})
+    print("✓ Cache hit reports its own raw body")
+
+    client.call_completion("Role: C", temperature=0.0, **params)
+    assert client.last_raw_response == json.dumps({'node_output_signal': 'C output'})
+    for _ in range(2):
+        client.call_completion("Role: A", temperature=0.5, **params)
+    assert [call[0] for call in provider.calls] == ['A', 'B', 'C', 'A', 'A']
+    print("✓ Sampled calls bypass the cache")
+
+    # DeepSeek caches only its async path; blocking calls are LLMClient's
+    from deepseek_provider import DeepSeekProvider
+
+    counts = {'sync': 0, 'async': 0}
+
+    def completion(kind):
+        counts[kind] += 1
+        message = SimpleNamespace(content=json.dumps({kind: counts[kind]}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def acreate(**kwargs):
+        return completion('async')
+
+    deepseek = DeepSeekProvider("test-key")
+    deepseek.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: completion('sync'))))
+    deepseek.aclient = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=acreate)))
+    call = dict(prompt="p", model="deepseek-chat", temperature=0.0, max_tokens=16,
+                response_format={'type': 'json_object'})
+    assert deepseek.call_completion(**call) == {'sync': 1}
+    assert deepseek.call_completion(**call) == {'sync': 2}
+
+    async def twice():
+        return [await deepseek.acall_completion(**call) for _ in range(2)]
+
+    assert asyncio.run(twice()) == [{'async': 1}, {'async': 1}]
+    assert deepseek.last_raw_response == json.dumps({'async': 1})
+    print("✓ DeepSeek caches async calls only")
+    return True
+
+def test_elucidator_parsing():
+    """Test ELUCIDATOR task entry parsing and role-name rules."""
+    print("\nTesting ELUCIDATOR task parsing...")
+    from mini_ccn import CCNError
+
+    with stub_ccn(StubProvider()) as ccn:
+        for raw, expected in (
+            ("ROLE: PHASE2. Plan phase two.", 'PHASE2'),
+            ("ROLE: STEP_2A. Run step 2a.", 'STEP_2A'),
+            ("ROLE: data_analyst. Lowercase names are normalized.", 'DATA_ANALYST'),
+            ("ROLE: ÄÖ. Non-ASCII uppercase is accepted.", 'ÄÖ'),
+        ):
+            spec = ccn._parse_task_entry(0, ["task", raw])
+            assert spec['role_name'] == expected, (raw, spec['role_name'])
+        print("✓ Valid role names accepted")
+
+        for raw in (
+            "ROLE: ANALYST without a separator",
+            "ROLE: . Empty name.",
+            "ROLE: STEP_2. Digit-only part.",
+            "No role declaration here.",
+        ):
+            try:
+                ccn._parse_task_entry(0, ["task", raw])
+            except CCNError:
+                pass
+            else:
+                raise AssertionError(f"{raw!r} should be rejected")
+        print("✓ Missing separator, empty name and invalid parts rejected")
+    return True
+
+def test_worker_fanout():
+    """Test concurrent worker fan-out: spec order, failures and loop fallback."""
+    print("\nTesting worker fan-out...")
+    import asyncio
+    from mini_ccn import CCNError
+
+    workers = ['ALPHA', 'BETA', 'GAMMA']
+    expected_outputs = [f"{name} output" for name in workers]
+
+    # ALPHA finishes last and BETA first; results must still follow spec order
+    provider = StubProvider(delays={'ALPHA': 0.05, 'GAMMA': 0.02})
+    with stub_ccn(provider) as ccn:
+        ccn.execute("test query")
+        assert [r for r in provider.completed if r in workers] == ['BETA', 'GAMMA', 'ALPHA']
+        assert list(ccn.memory.aggregator_buffer) == expected_outputs
+        assert [r.node_id for r in ccn.memory.archive] == \
+            ['REFORMULATOR', 'ELUCIDATOR', *workers, 'SYNTHESIZER']
+        appended = [e.node_id for e in ccn.memory.run_log
+                    if e.data.get('action') == 'add_to_aggregator']
+        assert appended == workers
+        activated = [e.node_id for e in ccn.memory.run_log
+                     if e.data.get('action') == 'set_active_role']
+        assert activated == ['REFORMULATOR', 'ELUCIDATOR', *workers, 'SYNTHESIZER']
+        assert [name for name, _ in ccn.role_timings] == \
+            ['REFORMULATOR', 'ELUCIDATOR', *workers, 'SYNTHESIZER']
+    print("✓ Out-of-order completions recorded in spec order")
+
+    # LLM failures become placeholder results, stay out of the aggregator,
+    # and the cycle completes
+    provider = StubProvider(failures={'BETA'})
+    with stub_ccn(provider) as ccn:
+        ccn.execute("test query")
+        assert list(ccn.memory.aggregator_buffer) == ["ALPHA output", "GAMMA output"]
+        assert {e.node_id for e in ccn.memory.run_log if e.event_type == 'error'} == {'BETA'}
+        assert ccn.get_metrics()['llm_errors'] == 1
+    with stub_ccn(StubProvider(failures={'BETA'})) as ccn:
+        ccn.process_elucidator(ccn.process_reformulator("test query"))
+        results = ccn.process_worker_roles(ccn._worker_pairs)
+        assert results[0] == "ALPHA output" and results[2] == "GAMMA output"
+        assert results[1].startswith("Error in BETA:")
+    print("✓ Worker LLM error becomes a placeholder")
+
+    # Any other worker failure aborts the cycle
+    provider = StubProvider(outputs={'GAMMA': {}})
+    with stub_ccn(provider) as ccn:
+        try:
+            ccn.execute("test query")
+        except CCNError:
+            pass
+        else:
+            raise AssertionError("malformed worker output should raise CCNError")
+    print("✓ Non-LLM worker error raises CCNError")
+
+    # Inside a running event loop the workers fall back to the sequential path
+    async def run_in_loop():
+        provider = StubProvider(delays={'ALPHA': 0.05})
+        with stub_ccn(provider) as ccn:
+            ccn.execute("test query")
+            return list(ccn.memory.aggregator_buffer)
+
+    assert asyncio.run(run_in_loop()) == expected_outputs
+    print("✓ Running-loop fallback keeps spec order")
+    return True
+
+def test_worker_dedup():
+    """Test per-run deduplication of identical worker roles."""
+    print("\nTesting worker deduplication...")
+    from dataclasses import replace
+
+    decomposition = [
+        ["t1", "ROLE: BETA. Do beta."],
+        ["t2", "ROLE: BETA. Do beta."],
+        ["t3", "ROLE: GAMMA. Do gamma."],
+        ["t4", "ROLE: SYNTHESIZER. Combine all."],
+    ]
+    provider = StubProvider(decomposition=decomposition, delays={'BETA': 0.01})
+
+    def worker_calls():
+        return sorted(call[0] for call in provider.calls if call[0] in ('BETA', 'GAMMA'))
+
+    with stub_ccn(provider) as ccn:
+        # The duplicate BETA awaits the first one's in-flight call
+        ccn.execute("test query")
+        assert worker_calls() == ['BETA', 'GAMMA']
+        assert list(ccn.memory.aggregator_buffer) == ['BETA output', 'BETA output', 'GAMMA output']
+        reused = [e.data['entry_id'] for e in ccn.memory.run_log
+                  if e.data.get('action') == 'reuse_worker_result']
+        assert reused == ['beta_002']
+        print("✓ Identical specs share one provider call")
+
+        # Sampled outputs are not replayed by a later run
+        ccn.execute("test query")
+        assert worker_calls() == ['BETA', 'BETA', 'GAMMA', 'GAMMA']
+        print("✓ Second execute() calls the provider again")
+
+        # Roles differing only in LLM params are not merged
+        worker_specs, _ = ccn._parse_elucidator_tasks(decomposition)
+        role = ccn._bind_worker(worker_specs[0])
+        key = ccn._role_key(role)
+        assert ccn._role_key(ccn._bind_worker(worker_specs[1])) == key
+        greedy = replace(role, llm_config={**role.llm_config, 'temperature': 0.0})
+        other_model = replace(role, llm_config={**role.llm_config, 'model': 'other-model'})
+        assert ccn._role_key(greedy) != key
+        assert ccn._role_key(other_model) != key
+        print("✓ Model and temperature are part of the dedup key")
+    return True
+
+def test_ccn_options():
+    """Test MiniCCN max_inflight and archive_mode options."""
+    print("\nTesting MiniCCN options...")
+    for kwargs in ({'max_inflight': 0}, {'archive_mode': 'partial'}):
+        try:
+            stub_ccn(StubProvider(), **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{kwargs} should raise ValueError")
+    print("✓ Invalid max_inflight and archive_mode rejected")
+
+    delays = {'ALPHA': 0.01, 'BETA': 0.01, 'GAMMA': 0.01}
+    for limit, expected_peak in ((1, 1), (2, 2), (8, 3)):
+        provider = StubProvider(delays=delays)
+        with stub_ccn(provider, max_inflight=limit) as ccn:
+            ccn.execute("test query")
+        assert provider.peak_inflight == expected_peak, (limit, provider.peak_inflight)
+    print("✓ max_inflight bounds concurrent worker calls")
+
+    with stub_ccn(StubProvider(), archive_mode='final') as ccn:
+        ccn.execute("test query")
+        archive = list(ccn.memory.archive)
+        assert [r.node_id for r in archive] == ['SYNTHESIZER']
+        assert archive[0].input_signals == []
+        assert archive[0].node_output_signal == "SYNTHESIZER output"
+    print("✓ archive_mode='final' keeps only the SYNTHESIZER record")
+
+    with stub_ccn(StubProvider(), archive_mode='off') as ccn:
+        ccn.execute("test query")
+        assert len(ccn.memory.archive) == 0
+    print("✓ archive_mode='off' keeps no records")
+
+    # Role skeletons are per instance: a later MiniCCN sees changed defaults
+    from llm_config import clear_default_llm_config_cache
+    first = stub_ccn(StubProvider())
+    first_model = first._role_from_skeleton('WORKER').llm_config['model']
+    previous = os.environ.get('EPN_LLM_MODEL')
+    os.environ['EPN_LLM_MODEL'] = 'skeleton-test-model'
+    clear_default_llm_config_cache()
+    try:
+        second = stub_ccn(StubProvider())
+        assert second._role_from_skeleton('WORKER').llm_config['model'] == 'skeleton-test-model'
+        assert first._role_from_skeleton('WORKER').llm_config['model'] == first_model
+    finally:
+        if previous is None:
+            os.environ.pop('EPN_LLM_MODEL', None)
+        else:
+            os.environ['EPN_LLM_MODEL'] = previous
+        clear_default_llm_config_cache()
+        first.close()
+    print("✓ Role skeletons are not shared between instances")
+    return True
+
+def test_compiled_prompt():
+    """Test CompiledPrompt rendering against str.format."""
+    print("\nTesting compiled prompts...")
+    from llm_client import CompiledPrompt, LLMClient, LLMError
+
+    template = "Role: {role}\n\nInputs: {inputs}\n{{literal}} {role}"
+    variables = {'role': 'ALPHA', 'inputs': ['a', 1]}
+    compiled = CompiledPrompt(template)
+    assert compiled.render(**variables) == template.format(**variables)
+    print("✓ Renders the same text as str.format")
+
+    params = {'model': 'stub-model', 'temperature': 0.5, 'max_tokens': 16,
+              'response_format': {'type': 'json_object'}}
+    client = LLMClient(provider=StubProvider())
+    assert client.call_template(compiled, variables, **params) == {'node_output_signal': 'ALPHA output'}
+
+    try:
+        template.format(role='ALPHA')
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("str.format should reject a missing field")
+    try:
+        client.call_template(compiled, {'role': 'ALPHA'}, **params)
+    except LLMError as e:
+        assert "inputs" in str(e)
+    else:
+        raise AssertionError("missing prompt variable should raise LLMError")
+    print("✓ Missing field raises LLMError")
+
+    try:
+        CompiledPrompt("{role:>10}")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("format specs should be rejected")
+    print("✓ Format specs rejected at compile time")
+    return True
+
 def run_all_tests():
     """Run all tests."""
     print("Running CCN Minimal EPN Cycle Tests")
@@ -206,9 +638,17 @@ def run_all_tests():
     tests = [
         test_imports,
         test_memory_structures,
+        test_event_log,
         test_synaptic_validation,
         test_node_templates,
         test_schema_validation,
+        test_archive_validation,
+        test_compiled_prompt,
+        test_completion_cache,
+        test_elucidator_parsing,
+        test_worker_fanout,
+        test_worker_dedup,
+        test_ccn_options,
         test_cli_basic
     ]
     
@@ -1,7 +1,9 @@
 """WorkerNode class for executing CCN roles."""
 
-import json
 from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+
 from mini_memory import MaterializedRole, CCNEvent
 from template_loader import repo
 from llm_client import LLMClient, LLMError
@@ -81,16 +83,15 @@ class WorkerNode:
 
         return "\n".join(prompt_parts)
     
-    def prompt_call(self, role: MaterializedRole) -> Dict[str, Any]:
-        """Make LLM call for the role."""
-        prompt = self.build_prompt(role)
-        
-        # Log prompt windows (trimmed and full) for auditing
+    def _log_prompt(self, role: MaterializedRole, prompt: str) -> None:
+        """Emit trimmed and full prompt windows for auditing."""
+        # Log prompt windows (trimmed and full) for auditing; each trimmed
+        # preview is one allocation, and short texts are shared as-is
         self._emit_event(CCNEvent(
             event_type='prompt_window',
             node_id=role.node_id,
             data={
-                'prompt': prompt[:2000] + '...' if len(prompt) > 2000 else prompt,
+                'prompt': f"{prompt[:2000]}..." if len(prompt) > 2000 else prompt,
                 'llm_config': role.llm_config
             }
         ))
@@ -103,40 +104,70 @@ class WorkerNode:
             }
         ))
 
-        try:
-            # Prefer template-level LLM configuration; if templates are absent,
-            # fall back to hardcoded safe defaults from llm_config.py
-            params = repo().get_llm_overrides()
-            if not params:
-                params = get_default_llm_config()
-            response = self.llm_client.call_completion(
-                prompt=prompt,
-                model=params.get('model'),
-                temperature=params.get('temperature'),
-                max_tokens=params.get('max_tokens'),
-                reasoning_effort=params.get('reasoning_effort'),
-                response_format=params.get('response_format')
-            )
-            raw_body = getattr(self.llm_client, "last_raw_response", None)
-            if raw_body is not None:
-                trimmed_raw = raw_body[:2000] + '...' if len(raw_body) > 2000 else raw_body
-                self._emit_event(CCNEvent(
-                    event_type='raw_response',
-                    node_id=role.node_id,
-                    data={'body': trimmed_raw}
-                ))
-            response_json = json.dumps(response)
-            trimmed_parsed = response_json[:2000] + '...' if len(response_json) > 2000 else response_json
+    @staticmethod
+    def _llm_params(prompt: str) -> Dict[str, Any]:
+        """Keyword arguments for the LLM call.
+
+        Prefer template-level LLM configuration; if templates are absent,
+        fall back to hardcoded safe defaults from llm_config.py.
+        """
+        params = repo().get_llm_overrides()
+        if not params:
+            params = get_default_llm_config()
+        return {
+            'prompt': prompt,
+            'model': params.get('model'),
+            'temperature': params.get('temperature'),
+            'max_tokens': params.get('max_tokens'),
+            'reasoning_effort': params.get('reasoning_effort'),
+            'response_format': params.get('response_format')
+        }
+
+    def _log_response(self, role: MaterializedRole, response: Dict[str, Any]) -> None:
+        """Emit raw and parsed response bodies for auditing."""
+        raw_body = getattr(self.llm_client, "last_raw_response", None)
+        if raw_body is not None:
+            trimmed_raw = f"{raw_body[:2000]}..." if len(raw_body) > 2000 else raw_body
             self._emit_event(CCNEvent(
-                event_type='parsed_response',
+                event_type='raw_response',
                 node_id=role.node_id,
-                data={'body': trimmed_parsed}
+                data={'body': trimmed_raw}
             ))
+        response_json = orjson.dumps(response).decode()
+        trimmed_parsed = f"{response_json[:2000]}..." if len(response_json) > 2000 else response_json
+        self._emit_event(CCNEvent(
+            event_type='parsed_response',
+            node_id=role.node_id,
+            data={'body': trimmed_parsed}
+        ))
+
+    def prompt_call(self, role: MaterializedRole) -> Dict[str, Any]:
+        """Make LLM call for the role."""
+        prompt = self.build_prompt(role)
+        self._log_prompt(role, prompt)
 
+        try:
+            response = self.llm_client.call_completion(**self._llm_params(prompt))
+            self._log_response(role, response)
             return response
             
         except LLMError as e:
             raise LLMError(f"LLM call failed for role {role.node_id}: {str(e)}")
+
+    async def aprompt_call(self, role: MaterializedRole) -> Dict[str, Any]:
+        """Awaitable `prompt_call`, so independent roles can overlap their LLM calls."""
+        prompt = self.build_prompt(role)
+        self._log_prompt(role, prompt)
+
+        try:
+            response = await self.llm_client.acall_completion(**self._llm_params(prompt))
+            # No await between the call returning and here, so the client's
+            # last_raw_response still belongs to this role
+            self._log_response(role, response)
+            return response
+
+        except LLMError as e:
+            raise LLMError(f"LLM call failed for role {role.node_id}: {str(e)}")
     
     def emit(self, response: Dict[str, Any], role: MaterializedRole) -> Any:
         """Process and emit the response."""
@@ -186,7 +217,7 @@ class WorkerNode:
         start_event = CCNEvent(
             event_type='role_start',
             node_id=role.node_id,
-            data={'role': role.__dict__}
+            data={'role': role.summary()}
         )
         self._emit_event(start_event)
 
@@ -216,3 +247,29 @@ class WorkerNode:
             )
             self._emit_event(error_event)
             raise
+
+    async def aexecute_role(self, role: MaterializedRole) -> Any:
+        """Awaitable `execute_role` for concurrent worker fan-out."""
+        self._emit_event(CCNEvent(
+            event_type='role_start',
+            node_id=role.node_id,
+            data={'role': role.summary()}
+        ))
+
+        try:
+            response = await self.aprompt_call(role)
+            result = self.emit(response, role)
+            self._emit_event(CCNEvent(
+                event_type='role_complete',
+                node_id=role.node_id,
+                data={'result': result}
+            ))
+            return result
+
+        except Exception as e:
+            self._emit_event(CCNEvent(
+                event_type='error',
+                node_id=role.node_id,
+                data={'error': str(e)}
+            ))
+            raise